@@ -3,20 +3,21 @@
 Check extracted data word counts
 """
 import sys
+from dataclasses import asdict
 sys.path.insert(0, 'src')
 
 from scraper import JAMAScraper
 from extractor import ContentExtractor
+from utils import word_count
 
 url = "https://jamanetwork.com/journals/jama/fullarticle/2770277"
 
 print("🔍 Scraping and extracting...")
 scraper = JAMAScraper(url, verbose=False)
 html_content = scraper.scrape()
-soup = scraper.get_soup()
 
-extractor = ContentExtractor(soup, verbose=False)
-data = extractor.extract_all()
+extractor = ContentExtractor.from_html(html_content, verbose=False)
+data = asdict(extractor.extract_all())
 
 print("\n" + "="*70)
 print("📊 WORD COUNT CHECK")
@@ -33,11 +34,11 @@ limits = {
 
 for field, limit in limits.items():
     text = data.get(field, '')
-    word_count = len(text.split())
-    status = "✅" if word_count <= limit else "❌ OVER!"
+    count = word_count(text)
+    status = "✅" if count <= limit else "❌ OVER!"
 
     print(f"\n{field.upper().replace('_', ' ')}: {status}")
-    print(f"  Limit: {limit} words | Actual: {word_count} words")
+    print(f"  Limit: {limit} words | Actual: {count} words")
     print(f"  Text: {text}")
 
 print("\n" + "="*70)
@@ -2,7 +2,11 @@
 """
 Quick script to check PowerPoint content with word counts
 """
+import sys
+sys.path.insert(0, 'src')
+
 from pptx import Presentation
+from utils import word_count
 
 prs = Presentation('output/Effect_of_Dexamethasone_on_Ventilator-Free_Days_in.pptx')
 
@@ -32,10 +36,10 @@ for slide_num, slide in enumerate(prs.slides, 1):
                 print(f"\n[{text}]")
             elif current_field and text:
                 # This is the content for the current field
-                word_count = len(text.split())
+                count = word_count(text)
                 limit = limits.get(current_field, 999)
-                status = "✅" if word_count <= limit else f"❌ OVER LIMIT!"
-                print(f"  {status} ({word_count}/{limit} words): {text[:100]}...")
+                status = "✅" if count <= limit else f"❌ OVER LIMIT!"
+                print(f"  {status} ({count}/{limit} words): {text[:100]}...")
                 current_field = None
             else:
                 # Other content (title, footer, etc)
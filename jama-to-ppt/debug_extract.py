@@ -4,18 +4,24 @@ Debug script to analyze JAMA article structure
 """
 
 import sys
+from itertools import islice
 sys.path.insert(0, 'src')
 
 from scraper import JAMAScraper
 from bs4 import BeautifulSoup
+from lxml import etree
+import lxml.html
 import re
 
+META_NAME_RE = re.compile(r'citation|dc\.')
+
 url = "https://jamanetwork.com/journals/jama/fullarticle/2770277"
 
 print("🔍 Scraping article...")
-scraper = JAMAScraper(url, verbose=True)
+# Whole rendered page: this script inspects selectors outside the extractor's subtree
+scraper = JAMAScraper(url, verbose=True, full_page=True)
 html_content = scraper.scrape()
-soup = scraper.get_soup()
+soup = BeautifulSoup(html_content, 'lxml')
 
 # Save HTML for inspection
 with open('debug_article.html', 'w', encoding='utf-8') as f:
@@ -29,42 +35,53 @@ print("="*80)
 # Check for abstract sections
 print("\n1. Looking for Abstract sections...")
 
-# Try different abstract selectors
+# Abstract candidates in priority order, matched with one compiled XPath union
+HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
 abstract_selectors = [
-    'div.abstract',
-    'section.abstract',
-    'div[id="abstract"]',
-    'div.article-body-section'
+    ('div.abstract', f"self::div[{HAS_CLASS.format('abstract')}]"),
+    ('section.abstract', f"self::section[{HAS_CLASS.format('abstract')}]"),
+    ('div[id="abstract"]', "self::div[@id='abstract']"),
+    ('div.article-body-section', f"self::div[{HAS_CLASS.format('article-body-section')}]"),
 ]
+ABSTRACT_XPATH = etree.XPath(' | '.join(f"//*[{test}]" for _, test in abstract_selectors))
+
+tree = lxml.html.fromstring(html_content)
+candidates = ABSTRACT_XPATH(tree)
 
 abstract = None
-for selector in abstract_selectors:
-    abstract = soup.select_one(selector)
-    if abstract:
+for selector, test in abstract_selectors:
+    abstract = next((node for node in candidates if node.xpath(test)), None)
+    if abstract is not None:
         print(f"✅ Found abstract: {selector}")
         break
 
-if abstract:
+if abstract is not None:
     # Get full text first
-    full_text = abstract.get_text(separator='\n', strip=True)
+    full_text = '\n'.join(t.strip() for t in abstract.itertext() if t.strip())
     print(f"\n📝 Abstract text (first 500 chars):\n{full_text[:500]}...\n")
 
     # Look for structured sections
-    sections = abstract.find_all(['p', 'strong', 'h3', 'h4', 'dt', 'dd'])
-    for i, section in enumerate(sections[:20]):
-        text = section.get_text(strip=True)
+    sections = abstract.iter('p', 'strong', 'h3', 'h4', 'dt', 'dd')
+    for i, section in enumerate(islice(sections, 20)):
+        text = ''.join(t.strip() for t in section.itertext())
         if text and len(text) > 5:
-            print(f"  [{i}] {section.name}.{section.get('class', [''])[0]}: {text[:120]}...")
+            print(f"  [{i}] {section.tag}.{section.get('class', '').split(' ', 1)[0]}: {text[:120]}...")
 
 # Check for specific fields
 print("\n2. Looking for key sections...")
 keywords = ['Importance', 'Objective', 'Design', 'Setting', 'Participants',
             'Intervention', 'Main Outcomes', 'Results', 'Conclusions']
 
+KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+# One tree walk for all keywords, then bucket each hit by the keywords it contains
+hits = {keyword.lower(): [] for keyword in keywords}
+for elem in soup.find_all(['strong', 'b', 'h3', 'h4'], string=KEYWORD_RE):
+    for found in {m.lower() for m in KEYWORD_RE.findall(elem.string)}:
+        hits[found].append(elem)
+
 for keyword in keywords:
-    # Look for bold/strong tags with keyword
-    elements = soup.find_all(['strong', 'b', 'h3', 'h4'],
-                            string=re.compile(keyword, re.IGNORECASE))
+    elements = hits[keyword.lower()]
     if elements:
         for elem in elements[:2]:
             # Get next sibling or parent text
@@ -77,8 +94,15 @@ for keyword in keywords:
             print(f"  ✅ {keyword}: {next_text}...")
 
 print("\n3. Looking for meta tags...")
-meta_tags = soup.find_all('meta', attrs={'name': re.compile('citation|dc\\.')})
-for meta in meta_tags[:10]:
-    print(f"  {meta.get('name')}: {meta.get('content', '')[:80]}")
+# Stream meta elements straight from the saved file instead of walking the soup
+shown = 0
+for _, meta in etree.iterparse('debug_article.html', tag='meta', html=True, events=('end',)):
+    name = meta.get('name')
+    if name and META_NAME_RE.search(name):
+        print(f"  {name}: {meta.get('content', '')[:80]}")
+        shown += 1
+    meta.clear()
+    if shown >= 10:
+        break
 
 print("\n" + "="*80)
@@ -7,18 +7,193 @@ Converts JAMA Network articles to VA-formatted PowerPoint presentations
 import argparse
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from cache import ArticleCache
 from scraper import JAMAScraper
-from extractor import ContentExtractor
-from ppt_generator import VAPowerPointGenerator
-from ppt_generator_jama_oncology import JAMAOncologyPowerPointGenerator
+from extractor import ArticleData, ContentExtractor
 from utils import IconSelector, sanitize_filename
 
 
+def load_cached_article(cache: ArticleCache):
+    """Return cached ArticleData, or None on a miss or an outdated cache entry"""
+    cached = cache.load_data()
+    if not cached:
+        return None
+    try:
+        return ArticleData(**cached)
+    except TypeError:
+        return None
+
+
+def convert_article(url: str, args, scraper: JAMAScraper = None):
+    """
+    Scrape/extract one article (or load it from cache) and write its PowerPoint
+    Returns (output_path, method)
+    """
+    article_data, icon_type, output_path, method = prepare_article(url, args, scraper)
+
+    # Step 4: Generate PowerPoint
+    print("📝 PowerPoint oluşturuluyor...")
+    generate_presentation(article_data, icon_type, output_path, args.format, args.verbose)
+    print()
+
+    return output_path, method
+
+
+def prepare_article(url: str, args, scraper: JAMAScraper = None, article_data: ArticleData = None):
+    """
+    Steps 1-3 for one article: scrape/extract (or load from cache), select icon, pick output path
+    article_data: cached data the caller already loaded (the cache is not read again)
+    Returns (article_data, icon_type, output_path, method)
+    """
+    cache = None if args.no_cache else ArticleCache(url, verbose=args.verbose)
+    if article_data is None and cache:
+        article_data = load_cached_article(cache)
+
+    if article_data:
+        # Steps 1-2 skipped: extracted data already cached
+        print("✅ Makale verileri önbellekten yüklendi")
+        method = "Önbellek (cache)"
+        print()
+    else:
+        # Step 1: Scrape article (may already be fetched by scrape_many)
+        print("📥 Makale çekiliyor...")
+        if scraper is None:
+            scraper = JAMAScraper(url, verbose=args.verbose, use_cache=not args.no_cache)
+        if not scraper.html_content:
+            scraper.scrape()
+        method = scraper.successful_method
+        print()
+
+        # Step 2: Extract content
+        print("🔍 İçerik çıkarılıyor...")
+        extractor = ContentExtractor.from_html(scraper.html_content, verbose=args.verbose)
+        article_data = extractor.extract_all()
+        if cache:
+            cache.save_data(asdict(article_data))
+        print()
+
+    # Display extracted data if verbose
+    if args.verbose:
+        print("📋 Çıkarılan Veriler:")
+        print("-" * 60)
+        for key, value in article_data.items():
+            print(f"{key:20}: {value[:80]}..." if len(value) > 80 else f"{key:20}: {value}")
+        print()
+
+    # Step 3: Select icon
+    print("🎨 İkon seçiliyor...")
+    icon_type = IconSelector.select_icon(article_data, verbose=args.verbose)
+    print()
+
+    # Determine output path
+    if args.output:
+        output_path = args.output
+    else:
+        # Auto-generate from title
+        filename = sanitize_filename(article_data.title)
+        if not filename:
+            filename = 'jama_article'
+        filename = filename[:50]  # Limit filename length
+        output_path = f"output/{filename}.pptx"
+
+    # Create output directory if needed
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    return article_data, icon_type, output_path, method
+
+
+def generate_presentation(article_data: ArticleData, icon_type: str, output_path: str,
+                          fmt: str, verbose: bool = False) -> str:
+    """
+    Write one PowerPoint file; module-level so batch workers can run it in a separate process
+    """
+    # Generate presentation - SADECE YEŞİL TEMA (JAMA Oncology)
+    # Generators are imported lazily: only the selected one pulls in python-pptx/matplotlib
+    if fmt == 'jama-oncology':
+        from ppt_generator_jama_oncology import JAMAOncologyPowerPointGenerator
+        generator = JAMAOncologyPowerPointGenerator(article_data, icon_type, verbose=verbose)
+    else:
+        from ppt_generator import VAPowerPointGenerator
+        generator = VAPowerPointGenerator(article_data, icon_type, verbose=verbose)
+
+    generator.generate(output_path)
+    return output_path
+
+
+def convert_batch(args):
+    """
+    Convert several articles; downloads run concurrently, extraction sequentially,
+    and PowerPoint generation (CPU-bound XML building and zip deflate) in a process pool
+    """
+    # Articles with cached extracted data don't need to be fetched at all (loaded once, reused below)
+    cached = {}
+    if not args.no_cache:
+        for url in args.urls:
+            article_data = load_cached_article(ArticleCache(url))
+            if article_data:
+                cached[url] = article_data
+    to_fetch = [url for url in args.urls if url not in cached]
+
+    scrapers = {}
+    if to_fetch:
+        print(f"📥 {len(to_fetch)} makale eşzamanlı çekiliyor...")
+        for scraper in JAMAScraper.scrape_many(to_fetch, verbose=args.verbose, use_cache=not args.no_cache):
+            scrapers[scraper.url] = scraper
+        print()
+
+    outputs = {}
+    prepared = []
+    for index, url in enumerate(args.urls, 1):
+        print("-" * 60)
+        print(f"📄 [{index}/{len(args.urls)}] {url}")
+        print("-" * 60)
+        try:
+            article_data, icon_type, output_path, method = prepare_article(url, args, scrapers.get(url), cached.get(url))
+            prepared.append((url, article_data, icon_type, output_path))
+        except Exception as e:
+            report_error(e, args.verbose)
+            outputs[url] = None
+        print()
+
+    if prepared:
+        print(f"📝 {len(prepared)} PowerPoint paralel oluşturuluyor...")
+        workers = min(os.cpu_count() or 1, len(prepared))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (url, pool.submit(generate_presentation, article_data, icon_type, output_path,
+                                  args.format, args.verbose))
+                for url, article_data, icon_type, output_path in prepared
+            ]
+            for url, future in futures:
+                try:
+                    outputs[url] = future.result()
+                except Exception as e:
+                    print(f"❌ {url}")
+                    report_error(e, args.verbose)
+                    outputs[url] = None
+        print()
+
+    return [(url, outputs[url]) for url in args.urls]
+
+
+def report_error(error: Exception, verbose: bool):
+    """Print an error, with its traceback in verbose mode"""
+    print(f"❌ Hata oluştu: {str(error)}")
+    if verbose:
+        import traceback
+        traceback.print_exception(type(error), error, error.__traceback__)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='🎯 JAMA Makale → PowerPoint Dönüştürücü (VA Format)',
@@ -28,18 +203,24 @@ Examples:
   %(prog)s https://jamanetwork.com/journals/jama/fullarticle/12345
   %(prog)s <URL> --output my_presentation.pptx
   %(prog)s <URL> --verbose
+  %(prog)s <URL> --no-cache
+  %(prog)s <URL> --cache-max-age 7
+  %(prog)s <URL> --reset-tiers
+  %(prog)s <URL1> <URL2> <URL3>
   %(prog)s <URL> --use-ai --api-key sk-ant-...
         '''
     )
 
     parser.add_argument(
-        'url',
-        help='JAMA Network article URL'
+        'urls',
+        nargs='+',
+        metavar='url',
+        help='JAMA Network article URL (several URLs are processed as a batch)'
     )
 
     parser.add_argument(
         '-o', '--output',
-        help='Output PowerPoint file path (default: auto-generated from title)',
+        help='Output PowerPoint file path (default: auto-generated from title; single URL only)',
         default=None
     )
 
@@ -61,6 +242,26 @@ Examples:
         default=None
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached HTML/extracted data and re-scrape the article'
+    )
+
+    parser.add_argument(
+        '--reset-tiers',
+        action='store_true',
+        help="Forget which scraping methods failed for the URLs' domains and try all of them again"
+    )
+
+    parser.add_argument(
+        '--cache-max-age',
+        type=float,
+        metavar='DAYS',
+        default=None,
+        help='Re-scrape articles cached more than DAYS days ago (default: cache never expires)'
+    )
+
     parser.add_argument(
         '--format',
         choices=['va', 'jama-oncology'],
@@ -70,10 +271,22 @@ Examples:
 
     args = parser.parse_args()
 
-    # Validate URL
-    if 'jamanetwork.com' not in args.url:
-        print("❌ Hata: Lütfen geçerli bir JAMA Network URL'si girin")
-        print("   Örnek: https://jamanetwork.com/journals/jama/fullarticle/...")
+    # Validate URLs
+    for url in args.urls:
+        if 'jamanetwork.com' not in url:
+            print("❌ Hata: Lütfen geçerli bir JAMA Network URL'si girin")
+            print("   Örnek: https://jamanetwork.com/journals/jama/fullarticle/...")
+            sys.exit(1)
+
+    if args.reset_tiers:
+        for domain in {urlparse(url).netloc for url in args.urls}:
+            JAMAScraper.reset_tier_stats(domain)
+
+    if args.cache_max_age is not None:
+        ArticleCache.max_age = args.cache_max_age * 24 * 60 * 60
+
+    if args.output and len(args.urls) > 1:
+        print("❌ Hata: --output yalnızca tek URL ile kullanılabilir")
         sys.exit(1)
 
     # Check AI requirements
@@ -87,59 +300,23 @@ Examples:
     print()
 
     try:
-        # Step 1: Scrape article
-        print("📥 Makale çekiliyor...")
-        scraper = JAMAScraper(args.url, verbose=args.verbose)
-        html_content = scraper.scrape()
-        soup = scraper.get_soup()
-        print()
-
-        # Step 2: Extract content
-        print("🔍 İçerik çıkarılıyor...")
-        extractor = ContentExtractor(soup, verbose=args.verbose)
-        article_data = extractor.extract_all()
-        print()
+        if len(args.urls) > 1:
+            results = convert_batch(args)
+            failed = [url for url, output_path in results if output_path is None]
 
-        # Display extracted data if verbose
-        if args.verbose:
-            print("📋 Çıkarılan Veriler:")
-            print("-" * 60)
-            for key, value in article_data.items():
-                print(f"{key:20}: {value[:80]}..." if len(value) > 80 else f"{key:20}: {value}")
+            print("=" * 60)
+            print(f"✨ İşlem Tamamlandı! ({len(results) - len(failed)}/{len(results)} başarılı)")
+            print("=" * 60)
+            for url, output_path in results:
+                print(f"📁 {output_path}" if output_path else f"❌ {url}")
+            print(f"🎨 Format: {args.format}")
             print()
 
-        # Step 3: Select icon
-        print("🎨 İkon seçiliyor...")
-        icon_type = IconSelector.select_icon(article_data, verbose=args.verbose)
-        print()
+            if failed:
+                sys.exit(1)
+            return
 
-        # Step 4: Generate PowerPoint
-        print("📝 PowerPoint oluşturuluyor...")
-
-        # Determine output path
-        if args.output:
-            output_path = args.output
-        else:
-            # Auto-generate from title
-            filename = sanitize_filename(article_data['title'])
-            if not filename:
-                filename = 'jama_article'
-            filename = filename[:50]  # Limit filename length
-            output_path = f"output/{filename}.pptx"
-
-        # Create output directory if needed
-        output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        # Generate presentation - SADECE YEŞİL TEMA (JAMA Oncology)
-        if args.format == 'jama-oncology':
-            generator = JAMAOncologyPowerPointGenerator(article_data, icon_type, verbose=args.verbose)
-        else:
-            generator = VAPowerPointGenerator(article_data, icon_type, verbose=args.verbose)
-
-        generator.generate(output_path)
-        print()
+        output_path, method = convert_article(args.urls[0], args)
 
         # Success message
         print("=" * 60)
@@ -147,7 +324,7 @@ Examples:
         print("=" * 60)
         print(f"📁 Dosya: {output_path}")
         print(f"🎨 Format: {args.format}")
-        print(f"🔧 Yöntem: {scraper.successful_method}")
+        print(f"🔧 Yöntem: {method}")
         print()
 
     except KeyboardInterrupt:
@@ -161,6 +338,10 @@ Examples:
             traceback.print_exc()
         sys.exit(1)
 
+    finally:
+        # Close the browser shared across articles (if the Playwright tier was used)
+        JAMAScraper.shutdown()
+
 
 if __name__ == '__main__':
     main()
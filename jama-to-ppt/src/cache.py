@@ -0,0 +1,70 @@
+"""
+On-disk cache for scraped articles
+Stores raw HTML and extracted article data keyed by URL hash
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'jama'
+
+
+class ArticleCache:
+    """
+    Content-addressed cache: ~/.cache/jama/<sha256(url)>.html / .json
+    """
+
+    # Entries older than this many seconds are treated as missing (None: never expire)
+    max_age = None
+
+    def __init__(self, url: str, cache_dir: Path = DEFAULT_CACHE_DIR, verbose: bool = False):
+        self.url = url
+        self.cache_dir = Path(cache_dir)
+        self.verbose = verbose
+        self.key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _path(self, suffix: str) -> Path:
+        return self.cache_dir / f"{self.key}{suffix}"
+
+    def _read(self, suffix: str) -> Optional[str]:
+        path = self._path(suffix)
+        try:
+            if self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def _write(self, suffix: str, content: str):
+        # Cache failures must never break the pipeline
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._path(suffix).write_text(content, encoding='utf-8')
+        except OSError as e:
+            if self.verbose:
+                print(f"⚠️ Önbelleğe yazılamadı: {str(e)}")
+
+    def load_html(self) -> Optional[str]:
+        """Return cached HTML for the URL, or None"""
+        return self._read('.html')
+
+    def save_html(self, html_content: str):
+        """Store scraped HTML for the URL"""
+        self._write('.html', html_content)
+
+    def load_data(self) -> Optional[Dict[str, str]]:
+        """Return cached extracted article data, or None"""
+        content = self._read('.json')
+        if content is None:
+            return None
+        try:
+            return json.loads(content)
+        except ValueError:
+            return None
+
+    def save_data(self, article_data: Dict[str, str]):
+        """Store extracted article data for the URL"""
+        self._write('.json', json.dumps(article_data, ensure_ascii=False, indent=2))
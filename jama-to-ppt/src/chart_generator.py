@@ -5,6 +5,8 @@ Creates statistical charts and visualizations
 
 from typing import Dict, List, Tuple, Optional
 import re
+import math
+from functools import lru_cache
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import matplotlib
@@ -12,6 +14,24 @@ matplotlib.use('Agg')  # Use non-GUI backend
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Comparison-data patterns, compiled once at import
+# Group labels are capped at 8 words: an unbounded word run backtracks quadratically on
+# long number-free text, an atomic group would change matches ("support 10" -> "support 1", "0")
+_GROUP_RE = re.compile(r'(\w+(?:\s+\w+){0,7})\s*:?\s*[~≈]?\s*([0-9.]+)', re.IGNORECASE)
+_MEAN_DIFF_RE = re.compile(r'[Mm]ean\s+difference.*?([0-9.-]+)')
+_CI_RE = re.compile(r'95%\s*CI[,:]?\s*([0-9.-]+)\s+to\s+([0-9.-]+)')
+_P_RE = re.compile(r'[Pp]\s*=\s*\.?([0-9.]+)')
+_DIGIT_RE = re.compile(r'\d')
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool = False):
+    """Load (once per size/weight) the font used for PIL-drawn charts"""
+    try:
+        return ImageFont.truetype('DejaVuSans-Bold.ttf' if bold else 'DejaVuSans.ttf', size)
+    except OSError:
+        return ImageFont.load_default(size)
+
 
 class ChartGenerator:
     """Generate statistical charts for PowerPoint slides"""
@@ -25,48 +45,102 @@ class ChartGenerator:
         'error_bar': '#323232',
     }
 
+    # Bar charts with at most this many groups are drawn with PIL instead of matplotlib
+    PIL_MAX_GROUPS = 4
+
+    # Simple icons as (shape, [x0, y0, x1, y1] on a 200px canvas, color) draw lists
+    SIMPLE_ICONS = {
+        # Three simple person silhouettes (head, body)
+        'people': tuple(
+            part for x in (30, 90, 150) for part in (
+                ('ellipse', [x, 50, x + 40, 90], 'primary'),
+                ('rectangle', [x - 10, 95, x + 50, 150], 'primary'),
+            )
+        ),
+        # Simple building with cross
+        'hospital': (
+            ('rectangle', [50, 80, 150, 180], 'primary'),
+            ('rectangle', [85, 40, 115, 90], 'white'),
+            ('rectangle', [60, 55, 140, 75], 'white'),
+        ),
+        # Simple bar chart
+        'chart': tuple(
+            ('rectangle', [x, 160 - h, x + 35, 160], 'primary') for x, h in ((40, 60), (90, 100), (140, 80))
+        ),
+        # Target/bullseye
+        'target': (
+            ('ellipse', [40, 40, 160, 160], 'primary'),
+            ('ellipse', [70, 70, 130, 130], 'white'),
+            ('ellipse', [90, 90, 110, 110], 'primary'),
+        ),
+    }
+
+    # Rendered icon PNG bytes keyed by (icon_type, width, height, color)
+    _ICON_CACHE: Dict[Tuple, bytes] = {}
+
+    # Shared figure/axes (created by _get_axes), reused by every chart instead of re-allocating a canvas
+    _fig = None
+    _ax = None
+
+    @classmethod
+    def _get_axes(cls, width: int, height: int):
+        """Return the shared figure and axes, cleared and resized for a new chart"""
+        if cls._fig is None:
+            # Chart style set once, on first use rather than at import (rcParams are global)
+            plt.style.use('seaborn-v0_8-whitegrid')
+            cls._fig, cls._ax = plt.subplots(dpi=100)
+
+        cls._fig.set_size_inches(width/100, height/100)
+        cls._ax.clear()
+        # clear() keeps spine visibility from the previous chart
+        for spine in cls._ax.spines.values():
+            spine.set_visible(True)
+
+        return cls._fig, cls._ax
+
+    @classmethod
+    def _save_figure(cls) -> BytesIO:
+        """Render the shared figure to a PNG buffer"""
+        cls._fig.tight_layout()
+
+        buf = BytesIO()
+        cls._fig.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+        buf.seek(0)
+
+        return buf
+
     @staticmethod
     def extract_comparison_data(text: str) -> Optional[Dict]:
         """
         Extract comparison data from text
         Example: "Enhanced support: ~1.0, Foundational support: ~1.0"
         """
-        patterns = {
-            'group_values': r'(\w+(?:\s+\w+)*)\s*:?\s*[~≈]?\s*([0-9.]+)',
-            'mean_diff': r'[Mm]ean\s+difference.*?([0-9.-]+)',
-            'ci': r'95%\s*CI[,:]?\s*([0-9.-]+)\s+to\s+([0-9.-]+)',
-            'p_value': r'[Pp]\s*=\s*\.?([0-9.]+)',
-        }
+        # Every value pattern needs a digit: skip the regex passes for text without one
+        if not _DIGIT_RE.search(text):
+            return None
 
         data = {}
 
         # Extract group values
-        matches = re.findall(patterns['group_values'], text, re.IGNORECASE)
-        if matches:
-            groups = []
-            values = []
-            for group, value in matches:
-                if 'support' in group.lower() or 'group' in group.lower():
-                    groups.append(group.strip())
-                    values.append(float(value))
-
-            if groups and values:
-                data['groups'] = groups
-                data['values'] = values
+        pairs = [(group.strip(), float(value))
+                 for group, value in _GROUP_RE.findall(text)
+                 if 'support' in (lowered := group.lower()) or 'group' in lowered]
+        if pairs:
+            data['groups'], data['values'] = map(list, zip(*pairs))
 
         # Extract mean difference
-        md_match = re.search(patterns['mean_diff'], text)
+        md_match = _MEAN_DIFF_RE.search(text)
         if md_match:
             data['mean_diff'] = float(md_match.group(1))
 
         # Extract CI
-        ci_match = re.search(patterns['ci'], text)
+        ci_match = _CI_RE.search(text)
         if ci_match:
             data['ci_lower'] = float(ci_match.group(1))
             data['ci_upper'] = float(ci_match.group(2))
 
         # Extract p-value
-        p_match = re.search(patterns['p_value'], text)
+        p_match = _P_RE.search(text)
         if p_match:
             data['p_value'] = float(p_match.group(1))
 
@@ -83,56 +157,157 @@ class ChartGenerator:
         if not data or 'groups' not in data:
             return None
 
-        # Set up the plot
-        plt.figure(figsize=(width/100, height/100), dpi=100)
-        plt.style.use('seaborn-v0_8-whitegrid')
-
         groups = data['groups']
         values = data['values']
 
+        # Simple charts: skip matplotlib's figure/artist pipeline entirely
+        if len(groups) <= cls.PIL_MAX_GROUPS and max(values) > 0:
+            return cls._draw_bars_pil(data, width, height)
+
+        # Set up the plot
+        fig, ax = cls._get_axes(width, height)
+
         # Shorten group names for display
         display_groups = [cls._shorten_label(g) for g in groups]
 
         # Create bar chart
         x_pos = np.arange(len(groups))
-        bars = plt.bar(x_pos, values, color=cls.COLORS['primary'], alpha=0.8, width=0.6)
+        bars = ax.bar(x_pos, values, color=cls.COLORS['primary'], alpha=0.8, width=0.6)
 
         # Add error bars if CI available
         if 'ci_lower' in data and 'ci_upper' in data:
             ci_range = (data['ci_upper'] - data['ci_lower']) / 2
             errors = [ci_range] * len(values)
-            plt.errorbar(x_pos, values, yerr=errors, fmt='none',
+            ax.errorbar(x_pos, values, yerr=errors, fmt='none',
                         ecolor=cls.COLORS['error_bar'], capsize=5, capthick=2)
 
         # Customize plot
-        plt.xlabel('', fontsize=10)
-        plt.ylabel('Mean penetration (95% CI)', fontsize=10)
-        plt.xticks(x_pos, display_groups, fontsize=9, rotation=0)
-        plt.ylim(0, max(values) * 1.3)
+        ax.set_xlabel('', fontsize=10)
+        ax.set_ylabel('Mean penetration (95% CI)', fontsize=10)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(display_groups, fontsize=9, rotation=0)
+        ax.set_ylim(0, max(values) * 1.3)
 
         # Add value labels on bars
         for i, (bar, val) in enumerate(zip(bars, values)):
-            plt.text(bar.get_x() + bar.get_width()/2, val + 0.05,
+            ax.text(bar.get_x() + bar.get_width()/2, val + 0.05,
                     f'{val:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
 
         # Add p-value if available
         if 'p_value' in data:
             p_val = data['p_value']
-            plt.text(0.95, 0.95, f'P = {p_val:.2f}',
-                    transform=plt.gca().transAxes,
+            ax.text(0.95, 0.95, f'P = {p_val:.2f}',
+                    transform=ax.transAxes,
                     ha='right', va='top', fontsize=10,
                     bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-        plt.tight_layout()
+        return cls._save_figure()
+
+    @classmethod
+    def _draw_bars_pil(cls, data: Dict, width: int, height: int) -> BytesIO:
+        """
+        Draw the comparison bar chart directly with PIL
+        Same layout as the matplotlib version, rendered at the same 150 DPI scale
+        """
+        scale = 1.5
+        img_w, img_h = int(width * scale), int(height * scale)
+        img = Image.new('RGB', (img_w, img_h), (255, 255, 255))
+        draw = ImageDraw.Draw(img)
+
+        groups = data['groups']
+        values = data['values']
+        y_max = max(values) * 1.3
+
+        label_font = _load_font(int(10 * scale))
+        tick_font = _load_font(int(9 * scale))
+        value_font = _load_font(int(9 * scale), bold=True)
+        text_color = cls._hex_to_rgb(cls.COLORS['error_bar'])
+        grid_color = (204, 204, 204)
+
+        # Plot area
+        left, right = int(70 * scale), img_w - int(15 * scale)
+        top, bottom = int(15 * scale), img_h - int(30 * scale)
+
+        def y_to_px(y: float) -> int:
+            y = min(max(y, 0), y_max)
+            return int(bottom - (bottom - top) * y / y_max)
+
+        # Horizontal grid lines with y tick labels
+        ticks, decimals = cls._nice_ticks(0, y_max)
+        for y_val in ticks:
+            y_px = y_to_px(y_val)
+            draw.line([(left, y_px), (right, y_px)], fill=grid_color, width=1)
+            draw.text((left - 6, y_px), f'{y_val:.{decimals}f}', fill=text_color, font=tick_font, anchor='rm')
+        draw.rectangle([left, top, right, bottom], outline=grid_color, width=1)
+
+        # Y axis label (drawn horizontally, then rotated into place)
+        label = 'Mean penetration (95% CI)'
+        l, t, r, b = draw.textbbox((0, 0), label, font=label_font)
+        label_img = Image.new('RGBA', (r - l, b - t), (255, 255, 255, 0))
+        ImageDraw.Draw(label_img).text((-l, -t), label, fill=text_color, font=label_font)
+        label_img = label_img.rotate(90, expand=True)
+        img.paste(label_img, (int(5 * scale), (top + bottom - label_img.height) // 2), label_img)
+
+        # Bars (alpha 0.8 over white, as in the matplotlib version)
+        primary = cls._hex_to_rgb(cls.COLORS['primary'])
+        bar_color = tuple(int(255 - 0.8 * (255 - c)) for c in primary)
+        slot = (right - left) / len(groups)
+        bar_half = slot * 0.6 / 2
+
+        ci_range = None
+        if 'ci_lower' in data and 'ci_upper' in data:
+            ci_range = (data['ci_upper'] - data['ci_lower']) / 2
+
+        for i, (group, val) in enumerate(zip(groups, values)):
+            center = left + slot * (i + 0.5)
+            draw.rectangle([center - bar_half, y_to_px(val), center + bar_half, bottom], fill=bar_color)
+
+            # Error bar with caps
+            if ci_range is not None:
+                y_lo, y_hi = y_to_px(val - ci_range), y_to_px(val + ci_range)
+                cap = 5 * scale
+                draw.line([(center, y_lo), (center, y_hi)], fill=text_color, width=int(1.5 * scale))
+                for y_px in (y_lo, y_hi):
+                    if top < y_px < bottom:
+                        draw.line([(center - cap, y_px), (center + cap, y_px)], fill=text_color, width=int(2 * scale))
+
+            # Value label above bar, group label below axis
+            draw.text((center, y_to_px(val + 0.05)), f'{val:.1f}', fill=text_color, font=value_font, anchor='mb')
+            draw.text((center, bottom + 4 * scale), cls._shorten_label(group), fill=text_color, font=tick_font, anchor='mt')
+
+        # P-value box in top-right corner
+        if 'p_value' in data:
+            p_text = f"P = {data['p_value']:.2f}"
+            anchor_x, anchor_y = right - int(8 * scale), top + int(8 * scale)
+            l, t, r, b = draw.textbbox((anchor_x, anchor_y), p_text, font=label_font, anchor='rt')
+            pad = 4 * scale
+            draw.rounded_rectangle([l - pad, t - pad, r + pad, b + pad], radius=pad,
+                                   fill=(255, 255, 255), outline=text_color, width=1)
+            draw.text((anchor_x, anchor_y), p_text, fill=text_color, font=label_font, anchor='rt')
 
-        # Save to buffer
         buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+        img.save(buf, format='PNG')
         buf.seek(0)
-        plt.close()
 
         return buf
 
+    @staticmethod
+    def _nice_ticks(lo: float, hi: float, target: int = 5) -> Tuple[List[float], int]:
+        """
+        Tick positions in [lo, hi] at a "nice" step (1, 2, 2.5, 5 x 10^k)
+        Returns (ticks, decimals needed to label them)
+        """
+        raw_step = (hi - lo) / target
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+        decimals = max(0, -math.floor(math.log10(step)) + (1 if step / magnitude == 2.5 else 0))
+
+        first = math.ceil(lo / step - 1e-9)
+        last = math.floor(hi / step + 1e-9)
+        ticks = [round(i * step, decimals) for i in range(first, last + 1)]
+
+        return ticks, decimals
+
     @staticmethod
     def _shorten_label(label: str) -> str:
         """Shorten long labels for display"""
@@ -155,42 +330,82 @@ class ChartGenerator:
         if not data or 'mean_diff' not in data:
             return None
 
-        # Set up the plot
-        fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+        return cls._draw_forest_pil(data, width, height)
+
+    @classmethod
+    def _draw_forest_pil(cls, data: Dict, width: int, height: int) -> BytesIO:
+        """
+        Draw the forest plot (single effect + CI) directly with PIL
+        Rendered at the same 150 DPI scale as the matplotlib charts
+        """
+        scale = 1.5
+        img_w, img_h = int(width * scale), int(height * scale)
+        img = Image.new('RGB', (img_w, img_h), (255, 255, 255))
+        draw = ImageDraw.Draw(img)
 
         mean_diff = data.get('mean_diff', 0)
         ci_lower = data.get('ci_lower', mean_diff - 0.5)
         ci_upper = data.get('ci_upper', mean_diff + 0.5)
 
-        # Plot the effect
-        ax.plot([mean_diff], [0], 'o', color=cls.COLORS['primary'], markersize=12)
-        ax.plot([ci_lower, ci_upper], [0, 0], '-', color=cls.COLORS['secondary'], linewidth=3)
-
-        # Add vertical line at null effect (0)
-        ax.axvline(x=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
-
-        # Labels
-        ax.set_xlabel('Mean Difference (95% CI)', fontsize=10)
-        ax.set_yticks([])
-        ax.spines['left'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['top'].set_visible(False)
-
-        # Add text annotation
+        label_font = _load_font(int(10 * scale))
+        small_font = _load_font(int(9 * scale))
+        text_color = cls._hex_to_rgb(cls.COLORS['error_bar'])
+        grid_color = (204, 204, 204)
+
+        # Plot area; the effect annotation sits above it
+        left, right = int(10 * scale), img_w - int(10 * scale)
+        top, bottom = int(45 * scale), img_h - int(45 * scale)
+        mid_y = (top + bottom) // 2
+
+        # X range covers the CI and the null line, with 5% margins
+        lo, hi = min(ci_lower, 0), max(ci_upper, 0)
+        if hi == lo:
+            lo, hi = lo - 1, hi + 1
+        margin = (hi - lo) * 0.05
+        lo, hi = lo - margin, hi + margin
+
+        def x_to_px(x: float) -> float:
+            return left + (right - left) * (x - lo) / (hi - lo)
+
+        # Vertical grid lines with x tick labels, bottom axis line
+        ticks, decimals = cls._nice_ticks(lo, hi)
+        for x_val in ticks:
+            x_px = x_to_px(x_val)
+            draw.line([(x_px, top), (x_px, bottom)], fill=grid_color, width=1)
+            draw.text((x_px, bottom + 4 * scale), f'{x_val:.{decimals}f}', fill=text_color, font=small_font, anchor='mt')
+        draw.line([(left, bottom), (right, bottom)], fill=grid_color, width=1)
+        draw.text(((left + right) / 2, img_h - 4 * scale), 'Mean Difference (95% CI)',
+                  fill=text_color, font=label_font, anchor='mb')
+
+        # Dashed line at null effect (0)
+        zero_px = x_to_px(0)
+        dash = 4 * scale
+        y = top
+        while y < bottom:
+            draw.line([(zero_px, y), (zero_px, min(y + dash, bottom))], fill=(128, 128, 128), width=int(scale))
+            y += dash * 2
+
+        # CI line and effect marker
+        draw.line([(x_to_px(ci_lower), mid_y), (x_to_px(ci_upper), mid_y)],
+                  fill=cls._hex_to_rgb(cls.COLORS['secondary']), width=int(4 * scale))
+        radius = 8 * scale
+        mean_px = x_to_px(mean_diff)
+        draw.ellipse([mean_px - radius, mid_y - radius, mean_px + radius, mid_y + radius],
+                     fill=cls._hex_to_rgb(cls.COLORS['primary']))
+
+        # Effect annotation above the plot, P value in the bottom-right corner
         text_str = f'{mean_diff:.1f} ({ci_lower:.1f} to {ci_upper:.1f})'
-        ax.text(mean_diff, 0.1, text_str, ha='center', va='bottom', fontsize=9)
+        half_text = draw.textlength(text_str, font=small_font) / 2
+        text_x = min(max(mean_px, half_text), img_w - half_text)
+        draw.text((text_x, int(8 * scale)), text_str, fill=text_color, font=small_font, anchor='mt')
 
         if 'p_value' in data:
-            ax.text(0.95, 0.05, f'P = {data["p_value"]:.2f}',
-                   transform=ax.transAxes, ha='right', va='bottom', fontsize=9)
-
-        plt.tight_layout()
+            draw.text((right - 4 * scale, bottom - 4 * scale), f'P = {data["p_value"]:.2f}',
+                      fill=text_color, font=small_font, anchor='rb')
 
-        # Save to buffer
         buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+        img.save(buf, format='PNG')
         buf.seek(0)
-        plt.close()
 
         return buf
 
@@ -198,52 +413,36 @@ class ChartGenerator:
     def create_simple_icon(cls, icon_type: str, width: int = 200, height: int = 200) -> BytesIO:
         """
         Create simple vector-style icons using PIL
+        Icons are deterministic, so each variant is drawn once and served from cache
         """
+        key = (icon_type, width, height, cls.COLORS['primary'])
+        png = cls._ICON_CACHE.get(key)
+        if png is None:
+            png = cls._render_simple_icon(icon_type, width, height)
+            cls._ICON_CACHE[key] = png
+
+        return BytesIO(png)
+
+    @classmethod
+    def _render_simple_icon(cls, icon_type: str, width: int, height: int) -> bytes:
+        """Draw an icon with PIL and return its PNG bytes"""
         # Create image with transparent background
         img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
         draw = ImageDraw.Draw(img)
 
-        color = cls._hex_to_rgb(cls.COLORS['primary'])
-
-        if icon_type == 'people':
-            # Draw three simple person silhouettes
-            for i in range(3):
-                x_offset = 30 + i * 60
-                # Head
-                draw.ellipse([x_offset, 50, x_offset+40, 90], fill=color)
-                # Body
-                draw.rectangle([x_offset-10, 95, x_offset+50, 150], fill=color)
-
-        elif icon_type == 'hospital':
-            # Simple building with cross
-            draw.rectangle([50, 80, 150, 180], fill=color)
-            # Cross
-            cross_color = (255, 255, 255, 255)
-            draw.rectangle([85, 40, 115, 90], fill=cross_color)
-            draw.rectangle([60, 55, 140, 75], fill=cross_color)
-
-        elif icon_type == 'chart':
-            # Simple bar chart
-            heights = [60, 100, 80]
-            for i, h in enumerate(heights):
-                x = 40 + i * 50
-                draw.rectangle([x, 160-h, x+35, 160], fill=color)
-
-        elif icon_type == 'target':
-            # Target/bullseye
-            draw.ellipse([40, 40, 160, 160], fill=color)
-            draw.ellipse([70, 70, 130, 130], fill=(255, 255, 255, 255))
-            draw.ellipse([90, 90, 110, 110], fill=color)
+        colors = {'primary': cls._hex_to_rgb(cls.COLORS['primary']), 'white': (255, 255, 255, 255)}
+        draw_shape = {'ellipse': draw.ellipse, 'rectangle': draw.rectangle}
+
+        for shape, box, color in cls.SIMPLE_ICONS.get(icon_type, ()):
+            draw_shape[shape](box, fill=colors[color])
 
         # Save to buffer
         buf = BytesIO()
         img.save(buf, format='PNG')
-        buf.seek(0)
 
-        return buf
+        return buf.getvalue()
 
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(hex_color.lstrip('#')))
@@ -4,10 +4,147 @@ Enhanced to parse JAMA's structured citation_abstract meta tag
 """
 
 import re
-import html
+import calendar
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Optional, List
-from bs4 import BeautifulSoup
+from typing import Dict, Optional, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from utils import HTML_PARSER
+
+# Compiled once at import instead of per call
+_TITLE_SUFFIX_PIPE_RE = re.compile(r'\s*\|\s*JAMA.*$')
+_TITLE_SUFFIX_DASH_RE = re.compile(r'\s*-\s*JAMA.*$')
+_DATE_YM_RE = re.compile(r'(\d{4})-(\d{2})')
+# '2020-10-06' / '2020/10/06', and 'October 6, 2020' / '6 October 2020'
+_NUMERIC_DATE_RE = re.compile(r'(\d{4})([-/])(\d{1,2})\2(\d{1,2})')
+_TEXT_DATE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})|(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})')
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_DOI_PREFIX_RE = re.compile(r'^doi:\s*', re.IGNORECASE)
+_DOI_URL_RE = re.compile(r'https?://doi\.org/')
+_DOI_HREF_RE = re.compile(r'doi\.org')
+_ABSTRACT_CLASS_RE = re.compile(r'abstract')
+
+_POPULATION_RE = (
+    re.compile(r'(\d+\s+(?:participants?|patients?|individuals?|subjects?)[^.;]+?(?:age|years|COVID|ARDS|with|mean)[^.;]+)', re.IGNORECASE),
+    re.compile(r'(Patients? with [^.;]+)', re.IGNORECASE),
+    re.compile(r'(\d+\s+(?:participants?|patients?)[^.;]+)', re.IGNORECASE),
+)
+_POPULATION_TRAILER_RE = re.compile(r'\s+(?:according to|enrolled from|Final).*$', re.IGNORECASE)
+_POPULATION_FALLBACK_RE = (
+    re.compile(r'(?:Participants?|Population|Patients?)[:.\s]+([^.]+?)(?:\.|Intervention|Setting|Methods)', re.IGNORECASE),
+    re.compile(r'(\d+\s+(?:participants?|patients?|individuals?|subjects?)(?:[^.]+?)(?:aged?|mean age|median age)[^.]+)', re.IGNORECASE),
+    re.compile(r'(n\s*=\s*\d+[^.]+?)(?:\.|;)', re.IGNORECASE),
+)
+_INTERVENTION_FALLBACK_RE = (
+    re.compile(r'Intervention[:.\s]+([^.]+?)(?:\.|Main Outcomes?|Results?|Setting)', re.IGNORECASE),
+    re.compile(r'(?:received|underwent|assigned to|randomized to)\s+([^.]+?)(?:\.|;|compared)', re.IGNORECASE),
+    re.compile(r'(?:Treatment|Therapy|Drug|Medication)[:.\s]+([^.]+?)(?:\.|;)', re.IGNORECASE),
+)
+_SETTING_RE = re.compile(r'(?:conducted|performed|carried out|in)\s+(.+?)(?:\.|;|Participants)', re.IGNORECASE)
+_SETTING_FALLBACK_RE = (
+    re.compile(r'Setting[:.\s]+([^.]+?)(?:\.|Participants?|Methods?)', re.IGNORECASE),
+    re.compile(r'(?:conducted|performed|carried out)\s+(?:at|in)\s+([^.]+?)(?:\.|;)', re.IGNORECASE),
+    re.compile(r'(?:hospital|clinic|center|facility|institution)s?\s+(?:in|at|from)\s+([^.]+?)(?:\.|;)', re.IGNORECASE),
+)
+_OUTCOME_FALLBACK_RE = (
+    re.compile(r'(?:Main Outcomes? and Measures?|Primary Outcome|Primary Endpoint)[:.\s]+([^.]+?)(?:\.|Results?)', re.IGNORECASE),
+    re.compile(r'(?:measured|assessed|evaluated)\s+([^.]+?mortality|[^.]+?survival|[^.]+?incidence)', re.IGNORECASE),
+    re.compile(r'(?:outcome was|endpoint was)\s+([^.]+?)(?:\.|;)', re.IGNORECASE),
+)
+
+_SENTENCE_SPLIT_RE = re.compile(r'\.(?:\s+|\s*$)')
+_NUMERIC_FINDING_RE = re.compile(r'\d+\.?\d*%|\bp\s*[<>=]\s*0\.\d+|\bn\s*=\s*\d+|95%\s*CI|OR\s*=|HR\s*=|RR\s*=|\d+\s+days', re.IGNORECASE)
+_RESULTS_SECTION_RE = re.compile(r'Results?[:.\s]+(.+?)(?:Conclusions?|Discussion|$)', re.IGNORECASE | re.DOTALL)
+_CLAUSE_SPLIT_RE = re.compile(r'[.;]\s+')
+_NUMERIC_CLAUSE_RE = re.compile(r'\d+\.?\d*%|\bp\s*[<>=]\s*0\.\d+|\bn\s*=\s*\d+|OR\s*=|HR\s*=|RR\s*=', re.IGNORECASE)
+
+# _extract_numbers patterns, each scanned separately (they overlap, e.g. "p = 0.5%"),
+# results reported in this order
+_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'n\s*=\s*\d+',
+    r'\d+\.?\d*%',
+    r'p\s*[<>=]\s*0\.\d+',
+    r'mean\s+age\s+\d+\.?\d*',
+    r'median\s+age\s+\d+\.?\d*',
+    r'OR\s*=\s*\d+\.?\d*',
+    r'HR\s*=\s*\d+\.?\d*',
+    r'RR\s*=\s*\d+\.?\d*',
+))
+
+# Structured-abstract headings, lowercased, in lookup priority order
+_POPULATION_KEYS = ('participants', 'design, setting, and participants', 'population')
+_INTERVENTION_KEYS = ('interventions', 'intervention', 'exposures')
+_SETTING_KEYS = ('setting', 'design, setting, and participants')
+_OUTCOME_KEYS = ('main outcomes and measures', 'primary outcome', 'primary endpoint', 'main outcome measures')
+_RESULTS_KEY = 'results'
+
+# Meta tags every JAMA Network article page carries
+_JAMA_META_KEYS = frozenset(['og:title', 'citation_author', 'citation_publication_date', 'citation_doi'])
+
+# Tags (kept with their whole subtree) that ContentExtractor actually reads
+_KEEP_TAGS = frozenset(['meta', 'title', 'h1', 'time', 'a'])
+_KEEP_CLASSES = frozenset(['author-name', 'meta-article-author-list', 'meta-article-date',
+                           'doi', 'article-body-section'])
+
+
+def _keep_tag(name: str, attrs=None) -> bool:
+    """Parse filter: metadata tags plus abstract/author/date/DOI containers"""
+    if name in _KEEP_TAGS:
+        return True
+    if not attrs:
+        return False
+    if attrs.get('id') == 'abstract':
+        return True
+
+    classes = attrs.get('class') or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return any('abstract' in cls or cls in _KEEP_CLASSES for cls in classes)
+
+
+class _ExtractorStrainer(SoupStrainer):
+    """SoupStrainer that applies _keep_tag on both old and new bs4 APIs"""
+
+    def __init__(self):
+        # bs4 < 4.13 calls the name function with (name, attrs)
+        super().__init__(name=_keep_tag)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13 asks the strainer directly
+        return _keep_tag(name, attrs)
+
+
+@dataclass
+class ArticleData:
+    """
+    Fixed schema of the fields extracted from a JAMA article
+    Slotted for compact instances; supports dict-style get()/[] so code
+    written against plain article dicts keeps working
+    """
+    __slots__ = ('title', 'authors', 'publication_date', 'doi', 'population', 'intervention',
+                 'setting', 'primary_outcome', 'finding_1', 'finding_2')
+
+    title: str
+    authors: str
+    publication_date: str
+    doi: str
+    population: str
+    intervention: str
+    setting: str
+    primary_outcome: str
+    finding_1: str
+    finding_2: str
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def items(self):
+        return asdict(self).items()
 
 
 class ContentExtractor:
@@ -15,28 +152,61 @@ class ContentExtractor:
     Extracts structured content from JAMA articles with word limits and smart summarization
     """
 
+    @classmethod
+    def from_html(cls, html_content: str, verbose: bool = False) -> 'ContentExtractor':
+        """Build an extractor, parsing only the parts of the page it reads"""
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_ExtractorStrainer())
+        return cls(soup, verbose=verbose)
+
     def __init__(self, soup: BeautifulSoup, verbose: bool = False):
         self.soup = soup
         self.verbose = verbose
         self._structured_abstract = None  # Cache for parsed abstract
-
-    def extract_all(self) -> Dict[str, str]:
+        self._abstract_text = None  # Cache for flattened abstract text
+        self._findings = None  # Cache for Results sentences/numeric findings
+
+        # One pass over <meta> tags: name/property -> contents in document order
+        self._meta: Dict[str, List[str]] = {}
+        for tag in soup.find_all('meta'):
+            content = tag.get('content', '')
+            for key in {tag.get('name'), tag.get('property')} - {None}:
+                self._meta.setdefault(key, []).append(content)
+
+    def _meta_content(self, key: str) -> Optional[str]:
+        """First content of the meta tag with the given name/property, or None"""
+        contents = self._meta.get(key)
+        return contents[0] if contents else None
+
+    def extract_all(self) -> ArticleData:
         """Extract all required fields from article"""
         if self.verbose:
             print("🔍 İçerik analiz ediliyor...")
 
-        data = {
-            'title': self._extract_title(),
-            'authors': self._extract_authors(),
-            'publication_date': self._extract_date(),
-            'doi': self._extract_doi(),
-            'population': self._extract_population(),
-            'intervention': self._extract_intervention(),
-            'setting': self._extract_setting(),
-            'primary_outcome': self._extract_primary_outcome(),
-            'finding_1': self._extract_finding(1),
-            'finding_2': self._extract_finding(2),
-        }
+        if _JAMA_META_KEYS <= self._meta.keys():
+            # JAMA layout: straight-line meta lookups, no selector fallbacks
+            meta = self._meta
+            title = self._clean_title(meta['og:title'][0])
+            authors = self._format_authors(meta['citation_author'][:3])
+            publication_date = self._format_date(meta['citation_publication_date'][0])
+            doi = self._clean_doi(meta['citation_doi'][0])
+        else:
+            title = self._extract_title()
+            authors = self._extract_authors()
+            publication_date = self._extract_date()
+            doi = self._extract_doi()
+
+        data = ArticleData(
+            title=title,
+            authors=authors,
+            publication_date=publication_date,
+            doi=doi,
+            population=self._extract_population(),
+            intervention=self._extract_intervention(),
+            setting=self._extract_setting(),
+            primary_outcome=self._extract_primary_outcome(),
+            finding_1=self._extract_finding(1),
+            finding_2=self._extract_finding(2),
+        )
 
         if self.verbose:
             print("✅ İçerik çıkarma tamamlandı")
@@ -45,55 +215,51 @@ class ContentExtractor:
 
     def _extract_title(self) -> str:
         """Extract article title"""
-        # Try multiple selectors
-        selectors = [
-            'h1.meta-article-title',
-            'h1[property="name"]',
-            'h1.article-header__title',
-            'h1.content-title',
-            'meta[property="og:title"]',
-            'title'
-        ]
+        # og:title first: it carries the clean title on JAMA pages
+        title = self._meta_content('og:title')
+        if title is not None:
+            return self._clean_title(title)
 
-        for selector in selectors:
-            if 'meta' in selector or selector == 'title':
-                element = self.soup.find('meta', attrs={'property': 'og:title'}) if 'meta' in selector else self.soup.find('title')
-                if element:
-                    title = element.get('content') if 'meta' in selector else element.get_text()
-                    # Clean title
-                    title = re.sub(r'\s*\|\s*JAMA.*$', '', title)
-                    title = re.sub(r'\s*-\s*JAMA.*$', '', title)
-                    return title.strip()
-            else:
-                element = self.soup.select_one(selector)
-                if element:
-                    return element.get_text(strip=True)
+        for attrs in ({'property': 'name'}, {'class': 'article-header__title'}, {'class': 'content-title'}):
+            element = self.soup.find('h1', attrs=attrs)
+            if element:
+                return element.get_text(strip=True)
+
+        element = self.soup.find('title')
+        if element:
+            return self._clean_title(element.get_text())
 
         return "Article Title Not Found"
 
+    def _clean_title(self, title: str) -> str:
+        """Strip the '| JAMA ...' / '- JAMA ...' site suffix"""
+        title = _TITLE_SUFFIX_PIPE_RE.sub('', title)
+        title = _TITLE_SUFFIX_DASH_RE.sub('', title)
+        return title.strip()
+
     def _extract_authors(self) -> str:
         """Extract authors (first 3 + et al.)"""
-        author_selectors = [
-            'meta[name="citation_author"]',
-            'a.author-name',
-            'span.author-name',
-            '.meta-article-author-list .author'
-        ]
-
         authors = []
 
         # Try meta tags first
-        meta_authors = self.soup.find_all('meta', attrs={'name': 'citation_author'})
+        meta_authors = self._meta.get('citation_author')
         if meta_authors:
-            authors = [tag.get('content') for tag in meta_authors[:3]]
+            authors = meta_authors[:3]
         else:
-            # Try other selectors
-            for selector in author_selectors[1:]:
-                elements = self.soup.select(selector)
+            # Try a.author-name, span.author-name, then .meta-article-author-list .author
+            for name in ('a', 'span'):
+                elements = self.soup.find_all(name, class_='author-name', limit=3)
                 if elements:
-                    authors = [el.get_text(strip=True) for el in elements[:3]]
                     break
+            else:
+                author_list = self.soup.find(class_='meta-article-author-list')
+                elements = author_list.find_all(class_='author', limit=3) if author_list else []
+            authors = [el.get_text(strip=True) for el in elements]
 
+        return self._format_authors(authors)
+
+    def _format_authors(self, authors: List[str]) -> str:
+        """Join up to three authors, adding 'et al.' when there are three"""
         if authors:
             if len(authors) >= 3:
                 return f"{', '.join(authors)} et al."
@@ -104,40 +270,46 @@ class ContentExtractor:
 
     def _extract_date(self) -> str:
         """Extract publication date"""
-        date_selectors = [
-            'meta[name="citation_publication_date"]',
-            'meta[name="article:published_time"]',
-            'time[datetime]',
-            '.meta-article-date'
-        ]
+        for name in ('citation_publication_date', 'article:published_time'):
+            date_str = self._meta_content(name)
+            if date_str is not None:
+                return self._format_date(date_str)
 
-        for selector in date_selectors:
-            if 'meta' in selector and '[name="' in selector:
-                element = self.soup.find('meta', attrs={'name': selector.split('[name="')[1].rstrip('"]')})
-                if element:
-                    date_str = element.get('content')
-                    return self._format_date(date_str)
-            else:
-                element = self.soup.select_one(selector)
-                if element:
-                    date_str = element.get('datetime') or element.get_text(strip=True)
-                    return self._format_date(date_str)
+        element = self.soup.find('time', attrs={'datetime': True})
+        if element:
+            return self._format_date(element['datetime'] or element.get_text(strip=True))
+
+        element = self.soup.find(class_='meta-article-date')
+        if element:
+            return self._format_date(element.get('datetime') or element.get_text(strip=True))
 
         return datetime.now().strftime("%B %Y")
 
     def _format_date(self, date_str: str) -> str:
         """Format date to 'Month Year' format"""
         try:
-            # Try different date formats
-            for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%B %d, %Y', '%d %B %Y']:
+            year = month = day = None
+            match = _NUMERIC_DATE_RE.fullmatch(date_str)
+            if match:
+                year, _, month, day = match.groups()
+            else:
+                match = _TEXT_DATE_RE.fullmatch(date_str)
+                if match:
+                    if match.group(1):
+                        month_name, day, year = match.group(1, 2, 3)
+                    else:
+                        day, month_name, year = match.group(4, 5, 6)
+                    month = _MONTHS.get(month_name.lower())
+
+            if month:
                 try:
-                    dt = datetime.strptime(date_str, fmt)
+                    dt = datetime(int(year), int(month), int(day))
                     return dt.strftime("%B %Y")
                 except ValueError:
-                    continue
+                    pass  # e.g. day out of range for the month
 
             # If no format works, try to extract year and month
-            match = re.search(r'(\d{4})-(\d{2})', date_str)
+            match = _DATE_YM_RE.search(date_str)
             if match:
                 year, month = match.groups()
                 dt = datetime(int(year), int(month), 1)
@@ -150,31 +322,26 @@ class ContentExtractor:
 
     def _extract_doi(self) -> str:
         """Extract DOI number"""
-        doi_selectors = [
-            'meta[name="citation_doi"]',
-            'a[href*="doi.org"]',
-            '.doi'
-        ]
+        doi = self._meta_content('citation_doi')
+        if doi is not None:
+            return self._clean_doi(doi)
 
-        for selector in doi_selectors:
-            if 'meta' in selector:
-                element = self.soup.find('meta', attrs={'name': 'citation_doi'})
-                if element:
-                    doi = element.get('content')
-                    return self._clean_doi(doi)
-            else:
-                element = self.soup.select_one(selector)
-                if element:
-                    doi = element.get('href') if element.name == 'a' else element.get_text(strip=True)
-                    return self._clean_doi(doi)
+        element = self.soup.find('a', href=_DOI_HREF_RE)
+        if element:
+            return self._clean_doi(element['href'])
+
+        element = self.soup.find(class_='doi')
+        if element:
+            doi = element.get('href') if element.name == 'a' else element.get_text(strip=True)
+            return self._clean_doi(doi)
 
         return "DOI Not Found"
 
     def _clean_doi(self, doi: str) -> str:
         """Clean DOI format"""
         # Remove 'doi:' prefix and URL parts
-        doi = re.sub(r'^doi:\s*', '', doi, flags=re.IGNORECASE)
-        doi = re.sub(r'https?://doi\.org/', '', doi)
+        doi = _DOI_PREFIX_RE.sub('', doi)
+        doi = _DOI_URL_RE.sub('', doi)
         return doi.strip()
 
     def _get_structured_abstract(self) -> Dict[str, str]:
@@ -183,18 +350,18 @@ class ContentExtractor:
             return self._structured_abstract
 
         # Try to get from meta tag first (JAMA specific)
-        meta_abstract = self.soup.find('meta', attrs={'name': 'citation_abstract'})
-        if meta_abstract:
-            abstract_html = html.unescape(meta_abstract.get('content', ''))
-            # Parse the HTML content
-            abstract_soup = BeautifulSoup(abstract_html, 'html.parser')
+        meta_abstract = self._meta_content('citation_abstract')
+        if meta_abstract is not None:
+            # The attribute value is already entity-decoded markup; the parser
+            # decodes the entities inside it, so no html.unescape() pass
+            abstract_soup = BeautifulSoup(meta_abstract, HTML_PARSER, parse_only=SoupStrainer(['h3', 'p']))
 
             sections = {}
             current_section = None
 
             for elem in abstract_soup.find_all(['h3', 'p']):
                 if elem.name == 'h3':
-                    current_section = elem.get_text(strip=True)
+                    current_section = elem.get_text(strip=True).lower()
                     sections[current_section] = ""
                 elif elem.name == 'p' and current_section:
                     sections[current_section] = elem.get_text(separator=' ', strip=True)
@@ -207,7 +374,13 @@ class ContentExtractor:
         return {}
 
     def _get_abstract_text(self) -> str:
-        """Extract full abstract text"""
+        """Extract full abstract text (computed once per extractor)"""
+        if self._abstract_text is None:
+            self._abstract_text = self._find_abstract_text()
+        return self._abstract_text
+
+    def _find_abstract_text(self) -> str:
+        """Join the structured abstract, or fall back to the abstract DOM node"""
         # First try structured abstract
         structured = self._get_structured_abstract()
         if structured:
@@ -215,18 +388,22 @@ class ContentExtractor:
 
         # Fallback to DOM selectors
         abstract_selectors = [
-            'div.abstract',
-            'section.abstract',
-            'div[class*="abstract"]',
-            '#abstract',
-            'div.article-body-section:first-of-type'
+            ('div', {'class': 'abstract'}),
+            ('section', {'class': 'abstract'}),
+            ('div', {'class': _ABSTRACT_CLASS_RE}),
+            (None, {'id': 'abstract'})
         ]
 
-        for selector in abstract_selectors:
-            element = self.soup.select_one(selector)
+        for name, attrs in abstract_selectors:
+            element = self.soup.find(name, attrs=attrs)
             if element:
                 return element.get_text(separator=' ', strip=True)
 
+        # div.article-body-section:first-of-type
+        for element in self.soup.find_all('div', class_='article-body-section'):
+            if element.find_previous_sibling('div') is None:
+                return element.get_text(separator=' ', strip=True)
+
         return ""
 
     def _extract_population(self) -> str:
@@ -235,39 +412,27 @@ class ContentExtractor:
         structured = self._get_structured_abstract()
 
         # JAMA uses "Participants" or "Design, Setting, and Participants"
-        for key in ['Participants', 'Design, Setting, and Participants', 'Population']:
+        for key in _POPULATION_KEYS:
             if key in structured:
                 text = structured[key]
                 # Extract key info about participants
                 # Look for patient count, age, condition
-                patterns = [
-                    r'(\d+\s+(?:participants?|patients?|individuals?|subjects?)[^.;]+?(?:age|years|COVID|ARDS|with|mean)[^.;]+)',
-                    r'(Patients? with [^.;]+)',
-                    r'(\d+\s+(?:participants?|patients?)[^.;]+)'
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in _POPULATION_RE:
+                    match = pattern.search(text)
                     if match:
                         extracted = match.group(1).strip()
                         # Clean up trailing words
-                        extracted = re.sub(r'\s+(?:according to|enrolled from|Final).*$', '', extracted, flags=re.IGNORECASE)
+                        extracted = _POPULATION_TRAILER_RE.sub('', extracted)
                         return self._limit_words(extracted, 15)
 
                 # Otherwise return first sentence
-                first_sentence = text.split('.')[0]
+                first_sentence = text.split('.', 1)[0]
                 return self._limit_words(first_sentence, 15)
 
         # Fallback to regex patterns
         abstract = self._get_abstract_text()
-        patterns = [
-            r'(?:Participants?|Population|Patients?)[:.\s]+([^.]+?)(?:\.|Intervention|Setting|Methods)',
-            r'(\d+\s+(?:participants?|patients?|individuals?|subjects?)(?:[^.]+?)(?:aged?|mean age|median age)[^.]+)',
-            r'(n\s*=\s*\d+[^.]+?)(?:\.|;)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _POPULATION_FALLBACK_RE:
+            match = pattern.search(abstract)
             if match:
                 text = match.group(1).strip()
                 return self._limit_words(text, 15)
@@ -279,23 +444,17 @@ class ContentExtractor:
         # Try structured abstract first
         structured = self._get_structured_abstract()
 
-        for key in ['Interventions', 'Intervention', 'Exposures']:
+        for key in _INTERVENTION_KEYS:
             if key in structured:
                 text = structured[key]
                 # Return first sentence
-                first_sentence = text.split('.')[0]
+                first_sentence = text.split('.', 1)[0]
                 return self._limit_words(first_sentence, 15)
 
         # Fallback to regex
         abstract = self._get_abstract_text()
-        patterns = [
-            r'Intervention[:.\s]+([^.]+?)(?:\.|Main Outcomes?|Results?|Setting)',
-            r'(?:received|underwent|assigned to|randomized to)\s+([^.]+?)(?:\.|;|compared)',
-            r'(?:Treatment|Therapy|Drug|Medication)[:.\s]+([^.]+?)(?:\.|;)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _INTERVENTION_FALLBACK_RE:
+            match = pattern.search(abstract)
             if match:
                 text = match.group(1).strip()
                 return self._limit_words(text, 15)
@@ -307,28 +466,22 @@ class ContentExtractor:
         # Try structured abstract first
         structured = self._get_structured_abstract()
 
-        for key in ['Setting', 'Design, Setting, and Participants']:
+        for key in _SETTING_KEYS:
             if key in structured:
                 text = structured[key]
                 # Extract setting info (usually first part or mentions location)
                 # Look for location patterns
-                match = re.search(r'(?:conducted|performed|carried out|in)\s+(.+?)(?:\.|;|Participants)', text, re.IGNORECASE)
+                match = _SETTING_RE.search(text)
                 if match:
                     return self._limit_words(match.group(1), 10)
                 # Or get first sentence
-                first_sentence = text.split('.')[0]
+                first_sentence = text.split('.', 1)[0]
                 return self._limit_words(first_sentence, 10)
 
         # Fallback to regex
         abstract = self._get_abstract_text()
-        patterns = [
-            r'Setting[:.\s]+([^.]+?)(?:\.|Participants?|Methods?)',
-            r'(?:conducted|performed|carried out)\s+(?:at|in)\s+([^.]+?)(?:\.|;)',
-            r'(?:hospital|clinic|center|facility|institution)s?\s+(?:in|at|from)\s+([^.]+?)(?:\.|;)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _SETTING_FALLBACK_RE:
+            match = pattern.search(abstract)
             if match:
                 text = match.group(1).strip()
                 return self._limit_words(text, 10)
@@ -340,23 +493,17 @@ class ContentExtractor:
         # Try structured abstract first
         structured = self._get_structured_abstract()
 
-        for key in ['Main Outcomes and Measures', 'Primary Outcome', 'Primary Endpoint', 'Main Outcome Measures']:
+        for key in _OUTCOME_KEYS:
             if key in structured:
                 text = structured[key]
                 # Get first sentence or primary outcome description
-                first_sentence = text.split('.')[0]
+                first_sentence = text.split('.', 1)[0]
                 return self._limit_words(first_sentence, 20)
 
         # Fallback to regex
         abstract = self._get_abstract_text()
-        patterns = [
-            r'(?:Main Outcomes? and Measures?|Primary Outcome|Primary Endpoint)[:.\s]+([^.]+?)(?:\.|Results?)',
-            r'(?:measured|assessed|evaluated)\s+([^.]+?mortality|[^.]+?survival|[^.]+?incidence)',
-            r'(?:outcome was|endpoint was)\s+([^.]+?)(?:\.|;)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _OUTCOME_FALLBACK_RE:
+            match = pattern.search(abstract)
             if match:
                 text = match.group(1).strip()
                 return self._limit_words(text, 20)
@@ -365,23 +512,11 @@ class ContentExtractor:
 
     def _extract_finding(self, number: int) -> str:
         """Extract key findings (MAX 15 words each)"""
-        # Try structured abstract first
-        structured = self._get_structured_abstract()
-
-        if 'Results' in structured:
-            results_text = structured['Results']
-
-            # Split into sentences
-            sentences = re.split(r'\.(?:\s+|\s*$)', results_text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-
-            # Look for sentences with numerical data
-            findings = []
-            for sentence in sentences:
-                # Prioritize sentences with percentages, p-values, CI, or numbers
-                if re.search(r'\d+\.?\d*%|\bp\s*[<>=]\s*0\.\d+|\bn\s*=\s*\d+|95%\s*CI|OR\s*=|HR\s*=|RR\s*=|\d+\s+days', sentence, re.IGNORECASE):
-                    findings.append(sentence.strip())
+        if self._findings is None:
+            self._findings = self._collect_findings()
 
+        # Structured Results first, then the regex-parsed abstract
+        for sentences, findings in self._findings:
             # If we have enough findings with numbers, use them
             if len(findings) >= number:
                 return self._limit_words(findings[number - 1], 15)
@@ -390,51 +525,41 @@ class ContentExtractor:
             if len(sentences) >= number:
                 return self._limit_words(sentences[number - 1], 15)
 
-        # Fallback to regex parsing
-        abstract = self._get_abstract_text()
-        results_match = re.search(r'Results?[:.\s]+(.+?)(?:Conclusions?|Discussion|$)', abstract, re.IGNORECASE | re.DOTALL)
-
-        if results_match:
-            results_text = results_match.group(1)
-            sentences = re.split(r'[.;]\s+', results_text)
+        return f"Finding {number} not found"
 
-            # Look for sentences with numerical data
-            findings = []
-            for sentence in sentences:
-                if re.search(r'\d+\.?\d*%|\bp\s*[<>=]\s*0\.\d+|\bn\s*=\s*\d+|OR\s*=|HR\s*=|RR\s*=', sentence, re.IGNORECASE):
-                    findings.append(sentence.strip())
+    def _collect_findings(self) -> List[Tuple[List[str], List[str]]]:
+        """Split Results into sentences once; return (sentences, numeric findings) per source"""
+        sources = []
 
-            if len(findings) >= number:
-                return self._limit_words(findings[number - 1], 15)
+        # Try structured abstract first
+        structured = self._get_structured_abstract()
+        if _RESULTS_KEY in structured:
+            sentences = [stripped for s in _SENTENCE_SPLIT_RE.split(structured[_RESULTS_KEY]) if (stripped := s.strip())]
+            # Prioritize sentences with percentages, p-values, CI, or numbers
+            findings = [s for s in sentences if _NUMERIC_FINDING_RE.search(s)]
+            sources.append((sentences, findings))
 
-            if len(sentences) >= number:
-                return self._limit_words(sentences[number - 1], 15)
+        # Fallback to regex parsing
+        results_match = _RESULTS_SECTION_RE.search(self._get_abstract_text())
+        if results_match:
+            sentences = _CLAUSE_SPLIT_RE.split(results_match.group(1))
+            findings = [s.strip() for s in sentences if _NUMERIC_CLAUSE_RE.search(s)]
+            sources.append((sentences, findings))
 
-        return f"Finding {number} not found"
+        return sources
 
     def _limit_words(self, text: str, max_words: int) -> str:
         """Limit text to max words and add ellipsis if needed"""
-        words = text.split()
+        # Bounded split: the words past the limit stay in one unsplit remainder
+        words = text.split(None, max_words)
         if len(words) > max_words:
             return ' '.join(words[:max_words]) + '...'
         return text
 
     def _extract_numbers(self, text: str) -> List[str]:
         """Extract numerical data using regex"""
-        patterns = [
-            r'n\s*=\s*\d+',
-            r'\d+\.?\d*%',
-            r'p\s*[<>=]\s*0\.\d+',
-            r'mean\s+age\s+\d+\.?\d*',
-            r'median\s+age\s+\d+\.?\d*',
-            r'OR\s*=\s*\d+\.?\d*',
-            r'HR\s*=\s*\d+\.?\d*',
-            r'RR\s*=\s*\d+\.?\d*',
-        ]
-
         numbers = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            numbers.extend(matches)
+        for pattern in _NUMBER_PATTERNS:
+            numbers.extend(pattern.findall(text))
 
         return numbers
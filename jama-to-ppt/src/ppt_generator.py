@@ -2,13 +2,51 @@
 VA Format PowerPoint Generator
 """
 
-from typing import Dict
+import copy
+import re
+from bisect import bisect_left
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 
 
+# Text python-pptx would rewrite (line breaks, XML-illegal control chars)
+_SPECIAL_TEXT_RE = re.compile(r'[\x00-\x08\x0a-\x1f]')
+_has_special_text = _SPECIAL_TEXT_RE.search
+
+# Slide shapes as raw DrawingML, mirroring what the python-pptx calls below emit
+_TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {index}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"{anchor}><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"/><a:r><a:rPr{bold} sz="{size}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>'
+)
+_INFO_BOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rectangle {index}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln w="{line_width}"><a:solidFill><a:srgbClr val="{border}"/></a:solidFill></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr" wrap="square" tIns="{margin}" bIns="{margin}"/><a:lstStyle/>'
+    '<a:p><a:pPr algn="l"/><a:r><a:rPr b="1" sz="1200"><a:solidFill><a:srgbClr val="{title_color}"/></a:solidFill></a:rPr>'
+    '<a:t>{title}</a:t></a:r></a:p>{content}</p:txBody></p:sp>'
+)
+_BOX_CONTENT_XML = (
+    '<a:p><a:pPr algn="l"/><a:r><a:rPr sz="{size}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p>'
+)
+
+
 class VAPowerPointGenerator:
     """
     Generates PowerPoint presentations in Veterans Affairs (VA) format
@@ -48,22 +86,68 @@ class VAPowerPointGenerator:
     ROW_2_Y = 3.5
     ROW_3_Y = 5.2
 
+    # Info box text capacity (total chars) per content font size:
+    # ~35 chars/line x 6 lines at 10pt, scaling with the smaller glyphs
+    BOX_CAPACITY = {10: 35 * 6, 9: 39 * 7, 8: 44 * 8}
+    # Same table as parallel sorted tuples for a bisect lookup, largest font first
+    CONTENT_FONT_SIZES = (10, 9, 8)
+    CONTENT_LENGTH_LIMITS = (BOX_CAPACITY[10], BOX_CAPACITY[9], BOX_CAPACITY[8])
+
     # Footer
     FOOTER_Y = 7
     FOOTER_WIDTH = 9
 
-    def __init__(self, article_data: Dict[str, str], icon_type: str = 'medical', verbose: bool = False):
+    # Fixed geometry and line widths, converted to EMU once at class load
+    TITLE_RECT = (Inches(TITLE_LEFT), Inches(TITLE_TOP), Inches(TITLE_WIDTH), Inches(TITLE_HEIGHT))
+    FOOTER_RECT = (Inches(0.5), Inches(FOOTER_Y), Inches(FOOTER_WIDTH), Inches(0.4))
+    BOX_SIZE = (Inches(BOX_WIDTH), Inches(BOX_HEIGHT))
+    BOX_MARGIN = Inches(0.1)
+    BOX_LINE_WIDTH = Pt(2)
+
+    # Parsed default template shared by all instances (see _get_template)
+    _TEMPLATE = None
+
+    def __init__(self, article_data: Dict[str, str], icon_type: str = 'medical', verbose: bool = False,
+                 prs: Optional[Presentation] = None):
         self.data = article_data
         self.icon_type = icon_type
         self.verbose = verbose
-        self.prs = Presentation()
+        self.prs = prs if prs is not None else copy.deepcopy(self._get_template())
+
+    @classmethod
+    def from_template(cls, prs: Presentation, article_data: Dict[str, str],
+                      icon_type: str = 'medical', verbose: bool = False):
+        """Generator that adds its slide to an already loaded presentation (e.g. one deck per batch)"""
+        return cls(article_data, icon_type, verbose, prs=prs)
+
+    @classmethod
+    def _get_template(cls) -> Presentation:
+        """Empty sized presentation, built once and deep-copied per generator"""
+        if cls._TEMPLATE is None:
+            template = Presentation()
+
+            # Set slide dimensions
+            template.slide_width = Inches(cls.SLIDE_WIDTH)
+            template.slide_height = Inches(cls.SLIDE_HEIGHT)
+            cls._TEMPLATE = template
+        return cls._TEMPLATE
+
+    def generate(self, output_path: str, fast: bool = True):
+        """
+        Generate PowerPoint presentation
+        fast=True renders all shapes from one XML template; fast=False uses python-pptx shape calls
+        """
+        stream = self.generate_to_stream(fast)
 
-        # Set slide dimensions
-        self.prs.slide_width = Inches(self.SLIDE_WIDTH)
-        self.prs.slide_height = Inches(self.SLIDE_HEIGHT)
+        # The deck is zipped in memory, then written to disk in one buffered write
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(stream.getbuffer())
 
-    def generate(self, output_path: str):
-        """Generate PowerPoint presentation"""
+        if self.verbose:
+            print(f"✅ PowerPoint kaydedildi: {output_path}")
+
+    def generate_to_stream(self, fast: bool = True) -> BytesIO:
+        """Generate the presentation in memory, e.g. for HTTP/S3 consumers that need no file"""
         if self.verbose:
             print("📝 PowerPoint oluşturuluyor...")
 
@@ -71,55 +155,94 @@ class VAPowerPointGenerator:
         blank_slide_layout = self.prs.slide_layouts[6]  # Blank layout
         slide = self.prs.slides.add_slide(blank_slide_layout)
 
+        # Cache the max shape id so each add_* doesn't rescan every id on the slide
+        slide.shapes.turbo_add_enabled = True
+
         # Set background color
         background = slide.background
         fill = background.fill
         fill.solid()
         fill.fore_color.rgb = self.COLORS['background']
 
-        # Add title
-        self._add_title(slide)
-
-        # Add info boxes
-        self._add_info_box(slide, "Population", self.data['population'],
-                          self.LEFT_COLUMN_X, self.ROW_1_Y)
-        self._add_info_box(slide, "Intervention", self.data['intervention'],
-                          self.RIGHT_COLUMN_X, self.ROW_1_Y)
-        self._add_info_box(slide, "Setting", self.data['setting'],
-                          self.LEFT_COLUMN_X, self.ROW_2_Y)
-        self._add_info_box(slide, "Primary Outcome", self.data['primary_outcome'],
-                          self.RIGHT_COLUMN_X, self.ROW_2_Y)
-        self._add_info_box(slide, "Finding 1", self.data['finding_1'],
-                          self.LEFT_COLUMN_X, self.ROW_3_Y)
-        self._add_info_box(slide, "Finding 2", self.data['finding_2'],
-                          self.RIGHT_COLUMN_X, self.ROW_3_Y)
-
-        # Add footer
-        self._add_footer(slide)
+        texts = [self.data['title'], self._footer_text()] + [content for _, content, _, _ in self._info_boxes()]
+        if fast and not any(_has_special_text(text) for text in texts):
+            self._add_shapes_from_template(slide)
+        else:
+            # Add title
+            self._add_title(slide)
+
+            # Add info boxes
+            for box_title, content, left_pos, top_pos in self._info_boxes():
+                self._add_info_box(slide, box_title, content, left_pos, top_pos)
+
+            # Add footer
+            self._add_footer(slide)
 
         # Save presentation
-        self.prs.save(output_path)
+        stream = BytesIO()
+        self.prs.save(stream)
+        stream.seek(0)
+        return stream
+
+    def _info_boxes(self) -> List[Tuple[str, str, float, float]]:
+        """(box title, content, left, top) of the six info boxes"""
+        return [
+            ("Population", self.data['population'], self.LEFT_COLUMN_X, self.ROW_1_Y),
+            ("Intervention", self.data['intervention'], self.RIGHT_COLUMN_X, self.ROW_1_Y),
+            ("Setting", self.data['setting'], self.LEFT_COLUMN_X, self.ROW_2_Y),
+            ("Primary Outcome", self.data['primary_outcome'], self.RIGHT_COLUMN_X, self.ROW_2_Y),
+            ("Finding 1", self.data['finding_1'], self.LEFT_COLUMN_X, self.ROW_3_Y),
+            ("Finding 2", self.data['finding_2'], self.RIGHT_COLUMN_X, self.ROW_3_Y),
+        ]
+
+    def _add_shapes_from_template(self, slide):
+        """Render title, info boxes and footer as one XML fragment and parse it once"""
+        shapes = []
 
-        if self.verbose:
-            print(f"✅ PowerPoint kaydedildi: {output_path}")
+        title = self.data['title']
+        x, y, cx, cy = self.TITLE_RECT
+        shapes.append(_TEXTBOX_XML.format(
+            id=2, index=1, x=x, y=y, cx=cx, cy=cy,
+            anchor=' anchor="ctr"', bold=' b="1"', size=self._title_font_size(title) * 100,
+            color=self.COLORS['title_text'], text=escape(title)
+        ))
+
+        box_cx, box_cy = self.BOX_SIZE
+        for index, (box_title, content, left_pos, top_pos) in enumerate(self._info_boxes(), 2):
+            content, font_size = self._fit_content(content)
+            content_xml = _BOX_CONTENT_XML.format(
+                size=font_size * 100, color=self.COLORS['box_content'], text=escape(content)
+            )
+            shapes.append(_INFO_BOX_XML.format(
+                id=index + 1, index=index,
+                x=Inches(left_pos), y=Inches(top_pos), cx=box_cx, cy=box_cy,
+                fill=self.COLORS['box_background'], border=self.COLORS['box_border'], line_width=self.BOX_LINE_WIDTH,
+                margin=self.BOX_MARGIN, title_color=self.COLORS['box_title'], title=escape(box_title),
+                content=content_xml
+            ))
+
+        x, y, cx, cy = self.FOOTER_RECT
+        shapes.append(_TEXTBOX_XML.format(
+            id=9, index=8, x=x, y=y, cx=cx, cy=cy,
+            anchor='', bold='', size=900, color=self.COLORS['footer_text'], text=escape(self._footer_text())
+        ))
+
+        fragment = parse_xml(f'<p:spTree {nsdecls("a", "p")}>{"".join(shapes)}</p:spTree>')
+        sp_tree = slide.shapes._spTree
+        for shape in list(fragment):
+            sp_tree.append(shape)
+
+    def _title_font_size(self, title: str) -> int:
+        """Determine font size based on title length"""
+        return 18 if len(title) > 80 else 24
 
     def _add_title(self, slide):
         """Add title box to slide"""
         title = self.data['title']
-
-        # Determine font size based on title length
-        if len(title) > 80:
-            font_size = 18
-        else:
-            font_size = 24
+        font_size = self._title_font_size(title)
 
         # Create title text box
-        left = Inches(self.TITLE_LEFT)
-        top = Inches(self.TITLE_TOP)
-        width = Inches(self.TITLE_WIDTH)
-        height = Inches(self.TITLE_HEIGHT)
-
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*self.TITLE_RECT)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
         text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
@@ -137,30 +260,27 @@ class VAPowerPointGenerator:
 
     def _add_info_box(self, slide, box_title: str, content: str, left_pos: float, top_pos: float):
         """Add information box with title and content"""
-        left = Inches(left_pos)
-        top = Inches(top_pos)
-        width = Inches(self.BOX_WIDTH)
-        height = Inches(self.BOX_HEIGHT)
+        width, height = self.BOX_SIZE
 
         # Create box shape
         box = slide.shapes.add_shape(
             1,  # Rectangle
-            left, top, width, height
+            Inches(left_pos), Inches(top_pos), width, height
         )
 
         # Format box
         box.fill.solid()
         box.fill.fore_color.rgb = self.COLORS['box_background']
         box.line.color.rgb = self.COLORS['box_border']
-        box.line.width = Pt(2)
+        box.line.width = self.BOX_LINE_WIDTH
 
         # Add text frame
         text_frame = box.text_frame
         text_frame.word_wrap = True
-        text_frame.margin_top = Inches(0.1)
-        text_frame.margin_bottom = Inches(0.1)
-        text_frame.margin_left = Inches(0.1)
-        text_frame.margin_right = Inches(0.1)
+        text_frame.margin_top = self.BOX_MARGIN
+        text_frame.margin_bottom = self.BOX_MARGIN
+        text_frame.margin_left = self.BOX_MARGIN
+        text_frame.margin_right = self.BOX_MARGIN
 
         # Clear default paragraph
         text_frame.clear()
@@ -174,50 +294,35 @@ class VAPowerPointGenerator:
         title_run.font.size = Pt(12)
         title_run.font.color.rgb = self.COLORS['box_title']
 
-        # Add content paragraph
+        # Add content paragraph, sized (and truncated) up front so the font is set once
+        content, font_size = self._fit_content(content)
         content_p = text_frame.add_paragraph()
         content_p.text = content
         content_p.alignment = PP_ALIGN.LEFT
 
-        # Try different font sizes if text overflows
-        font_size = 10
         content_run = content_p.runs[0]
         content_run.font.size = Pt(font_size)
         content_run.font.color.rgb = self.COLORS['box_content']
 
-        # Check if text fits, reduce font size if needed
-        if self._text_overflows(content, width, height):
-            for size in [9, 8]:
-                content_run.font.size = Pt(size)
-                if not self._text_overflows(content, width, height):
-                    break
-            else:
-                # If still overflows, truncate with ellipsis
-                max_chars = int(len(content) * 0.7)
-                content_p.text = content[:max_chars] + '...'
-
-    def _text_overflows(self, text: str, width, height) -> bool:
+    def _fit_content(self, text: str) -> Tuple[str, int]:
         """
-        Simple heuristic to check if text might overflow
-        This is approximate - actual overflow depends on font metrics
+        Largest content font size (10/9/8pt) whose box capacity fits the text,
+        truncating with an ellipsis if even 8pt overflows
+        Approximate - actual overflow depends on font metrics
         """
-        # Rough estimate: ~10 characters per inch at 10pt
-        chars_per_line = int(width.inches * 10)
-        approx_lines = len(text) / chars_per_line
-        max_lines = int(height.inches * 5)  # ~5 lines per inch
+        index = bisect_left(self.CONTENT_LENGTH_LIMITS, len(text))
+        if index < len(self.CONTENT_FONT_SIZES):
+            return text, self.CONTENT_FONT_SIZES[index]
+        return text[:int(self.CONTENT_LENGTH_LIMITS[-1] * 0.95)] + '...', self.CONTENT_FONT_SIZES[-1]
 
-        return approx_lines > max_lines
+    def _footer_text(self) -> str:
+        return f"{self.data['authors']} | {self.data['publication_date']} | DOI: {self.data['doi']}"
 
     def _add_footer(self, slide):
         """Add footer with authors, date, and DOI"""
-        footer_text = f"{self.data['authors']} | {self.data['publication_date']} | DOI: {self.data['doi']}"
-
-        left = Inches(0.5)
-        top = Inches(self.FOOTER_Y)
-        width = Inches(self.FOOTER_WIDTH)
-        height = Inches(0.4)
+        footer_text = self._footer_text()
 
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*self.FOOTER_RECT)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
 
@@ -3,19 +3,113 @@ JAMA Oncology Format PowerPoint Generator
 Green theme for oncology journal
 """
 
+import copy
+from bisect import bisect_left
+from io import BytesIO
 from typing import Dict, Optional
+from xml.sax.saxutils import escape
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from PIL import Image, ImageDraw
 import re
 
-try:
-    from chart_generator import ChartGenerator
-    CHART_AVAILABLE = True
-except ImportError:
-    CHART_AVAILABLE = False
+from utils import word_count
+
+# Numbers highlighted in box content (e.g. "263", "10.3")
+_NUM_RE = re.compile(r'\d+\.?\d*')
+
+# ASCII digits dropped in C by str.translate for the digit check below
+_DROP_ASCII_DIGITS = str.maketrans('', '', '0123456789')
+
+
+def _has_digit(word: str) -> bool:
+    """Same result as any(char.isdigit() for char in word), scanned in C for ASCII words"""
+    if word.translate(_DROP_ASCII_DIGITS) != word:
+        return True
+    return not word.isascii() and any(char.isdigit() for char in word)
+
+
+# Runtime geometry goes straight to int EMU, as Inches() would, without a Length object per value
+_EMU_PER_INCH = 914400
+
+
+def _emu(inches: float) -> int:
+    """Inches to EMU, same rounding as pptx.util.Inches"""
+    return int(inches * _EMU_PER_INCH)
+
+
+# Box icons are pre-rendered PNGs; add_picture stores one image part per distinct PNG
+_ICON_PX = 128
+_ICON_SUPERSAMPLE = 4
+_ICON_MARGIN = 0.07  # transparent border (fraction of icon size) for outlines drawn past the edge
+_ICON_PNG_CACHE: Dict[str, bytes] = {}
+
+# Unfilled open polyline (custom geometry in EMU), styled like add_connector()'s lines
+_POLYLINE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Freeform {index}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/><a:rect l="l" t="t" r="r" b="b"/>'
+    '<a:pathLst><a:path w="{cx}" h="{cy}" fill="none">{path}</a:path></a:pathLst></a:custGeom>'
+    '<a:noFill/><a:ln w="{width}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="2"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="0"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="1"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor"><a:schemeClr val="tx1"/></a:fontRef></p:style>'
+    '</p:sp>'
+)
+_PATH_POINT_XML = '<a:{op}><a:pt x="{x}" y="{y}"/></a:{op}>'
+
+# Rectangle as add_shape(rect) emits it; style is the <a:solidFill>/<a:ln> pair
+_RECT_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rectangle {index}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '{style}</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+# Rectangle style from fill.solid() + line.fill.background()
+_FILL_NO_LINE_XML = '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill><a:ln><a:noFill/></a:ln>'
+# Single-run textbox, as add_textbox() + paragraph.text + _style_run() emit it
+_LABEL_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {index}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:noFill/></p:spPr><p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/><a:p>{run}</a:p></p:txBody></p:sp>'
+)
+
+# Shape fill and outline as emitted by fill.solid() + line.color/width setters
+_FILL_AND_BORDER_XML = (
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln w="{width}"><a:solidFill><a:srgbClr val="{border}"/></a:solidFill></a:ln>'
+)
+
+# Arial text run as emitted by python-pptx's run.font setters (name, color, bold, size)
+_RUN_XML = (
+    '<a:r><a:rPr{bold} sz="{size}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:latin typeface="Arial"/></a:rPr><a:t>{text}</a:t></a:r>'
+)
+# Left-aligned paragraph as add_paragraph() + alignment + space_after emit it
+_PARAGRAPH_XML = '<a:p><a:pPr algn="l"><a:spcAft><a:spcPts val="{space_after}"/></a:spcAft></a:pPr>{runs}</a:p>'
+# Control characters run.text escapes as _xHHHH_ (tab and line feed are kept)
+_CTRL_CHAR_RE = re.compile(r'[\x00-\x08\x0B-\x1F]')
+# Bound pattern methods: skip the attribute lookup on every run / line
+_sub_ctrl_chars = _CTRL_CHAR_RE.sub
+_find_numbers = _NUM_RE.finditer
+
+
+def _ctrl_char_escape(match) -> str:
+    return '_x%04X_' % ord(match.group())
+
+
+def _run_xml(text: str, size, color: RGBColor, bold: bool = False) -> str:
+    """<a:r> XML for one Arial run, escaped the same way run.text would store it"""
+    text = _sub_ctrl_chars(_ctrl_char_escape, text)
+    return _RUN_XML.format(
+        bold=' b="1"' if bold else '', size=size.centipoints, color=color,
+        text=escape(text, {'\r': '&#13;'})
+    )
 
 
 class JAMAOncologyPowerPointGenerator:
@@ -32,6 +126,14 @@ class JAMAOncologyPowerPointGenerator:
         'box_content': RGBColor(50, 50, 50),         # #323232 - Dark gray
         'footer_text': RGBColor(100, 100, 100),      # #646464 - Gray
         'accent': RGBColor(0, 130, 114),             # #008272 - Teal green for highlights
+        'slide_bg': RGBColor(255, 255, 255),         # #FFFFFF - White
+        'title_body': RGBColor(0, 0, 0),             # #000000 - Black
+        'box_border': RGBColor(200, 200, 200),       # #C8C8C8 - Light gray
+        'icon': RGBColor(0, 0, 0),                   # #000000 - Black outline icons
+        'chart_bg': RGBColor(255, 255, 255),         # #FFFFFF - White
+        'chart_border': RGBColor(220, 220, 220),     # #DCDCDC - Light gray
+        'control_line': RGBColor(128, 128, 128),     # #808080 - Gray (comparator arm)
+        'legend_text': RGBColor(60, 60, 60),         # #3C3C3C - Dark gray
     }
 
     # Dimensions (in inches) - Same as JAMA Open
@@ -50,6 +152,21 @@ class JAMAOncologyPowerPointGenerator:
     TITLE_LEFT = 0.5
     TITLE_WIDTH = 9.0
     TITLE_HEIGHT = 0.65
+    # Title font size by length: up to 70 chars -> 20pt, 71-100 -> 18pt, ..., over 150 -> 14pt
+    TITLE_LENGTH_LIMITS = (70, 100, 120, 150)
+    TITLE_FONT_SIZES = (20, 18, 16, 15, 14)
+
+    # Kelime limitleri - SENİN BELİRLEDİĞİN (per box title, looked up once per box)
+    WORD_LIMITS = {
+        'POPULATION': 15,
+        'INTERVENTION': 15,
+        'SETTINGS / LOCATIONS': 10,
+        'PRIMARY OUTCOME': 20,
+        'FINDINGS': 15  # Her findings için
+    }
+    DEFAULT_WORD_LIMIT = 20
+    # Placeholder for absent article fields
+    MISSING_TEXT = 'N/A'
 
     # Content boxes - SOL TARAF (2x2 grid - 4 kutu)
     LEFT_BOX_WIDTH = 2.8
@@ -69,34 +186,173 @@ class JAMAOncologyPowerPointGenerator:
     RIGHT_BOX_Y = 1.65
     RIGHT_BOX_HEIGHT = (LEFT_BOX_HEIGHT * 2) + LEFT_BOX_SPACING
 
+    # Left-side boxes: (title, data key, x, y, width, height)
+    _BOX_SPECS = (
+        ("POPULATION", 'population', LEFT_COL1_X, TOP_ROW_Y, LEFT_BOX_WIDTH, LEFT_BOX_HEIGHT),
+        ("INTERVENTION", 'intervention', LEFT_COL2_X, TOP_ROW_Y, LEFT_BOX_WIDTH, LEFT_BOX_HEIGHT),
+        ("SETTINGS / LOCATIONS", 'setting', LEFT_COL1_X, BOTTOM_ROW_Y, LEFT_BOX_WIDTH, LEFT_BOX_HEIGHT),
+        ("PRIMARY OUTCOME", 'primary_outcome', LEFT_COL2_X, BOTTOM_ROW_Y, LEFT_BOX_WIDTH, LEFT_BOX_HEIGHT),
+    )
+
+    # Box icons - (kind, (x0, y0, x1, y1) as fractions of ICON_SIZE, outline pt or None if filled)
+    ICON_SIZE = 0.3
+    ICON_SHAPES = {
+        # Brain/neurology - simple circle
+        "POPULATION": (
+            ('oval', (0, 0, 1, 1), 3),
+        ),
+        # Medication - two pills with division lines
+        "INTERVENTION": (
+            ('oval', (0, 0.2, 0.4, 0.8), 3),
+            ('rect', (-0.05, 0.48, 0.45, 0.52), None),
+            ('oval', (0.5, 0.2, 0.9, 0.8), 3),
+            ('rect', (0.45, 0.48, 0.95, 0.52), None),
+        ),
+        # Map location pin - circle over a downward triangle
+        "SETTINGS / LOCATIONS": (
+            ('oval', (0.25, 0, 0.75, 0.5), 3),
+            ('triangle', (0.3, 0.45, 0.7, 0.95), 3),
+        ),
+        # Target/outcome - concentric circles
+        "PRIMARY OUTCOME": (
+            ('oval', (0, 0, 1, 1), 2),
+            ('oval', (0.3, 0.3, 0.7, 0.7), None),
+        ),
+    }
+
+    # Name prefix of the box backgrounds/icons drawn on the blank layout
+    LAYOUT_BOX_NAME = "Oncology Box"
+
     # Footer - EXACT FROM REFERENCE
     FOOTER_Y = 7.0
     FOOTER_HEIGHT = 0.4
 
-    def __init__(self, article_data: Dict[str, str], icon_type: str = 'medical', verbose: bool = False):
+    # Fixed geometry and line widths, converted to EMU once at class load
+    HEADER_RECT = (Inches(0), Inches(0), Inches(SLIDE_WIDTH), Inches(HEADER_HEIGHT))
+    LOGO_RECT = (Inches(LOGO_LEFT), Inches(LOGO_TOP + 0.05), Inches(LOGO_WIDTH), Inches(LOGO_HEIGHT))
+    TITLE_RECT = (Inches(TITLE_LEFT), Inches(TITLE_TOP), Inches(TITLE_WIDTH), Inches(TITLE_HEIGHT))
+    FINDINGS_RECT = (Inches(RIGHT_BOX_X), Inches(RIGHT_BOX_Y), Inches(RIGHT_BOX_WIDTH), Inches(RIGHT_BOX_HEIGHT))
+    FOOTER_RECT = (Inches(0.3), Inches(FOOTER_Y), Inches(9.4), Inches(FOOTER_HEIGHT))
+    BOX_MARGINS = (Inches(0.7), Inches(0.1), Inches(0.15), Inches(0.15))  # top (icon space), bottom, left, right
+    FINDINGS_PADDING = Inches(0.15)
+    FINDINGS_TITLE_RECT = (FINDINGS_RECT[0] + FINDINGS_PADDING, FINDINGS_RECT[1] + Inches(0.12),
+                           FINDINGS_RECT[2] - 2 * FINDINGS_PADDING, Inches(0.25))
+    FINDINGS_TEXT_RECT = (FINDINGS_RECT[0] + FINDINGS_PADDING, FINDINGS_RECT[1] + Inches(0.45),
+                          FINDINGS_RECT[2] - 2 * FINDINGS_PADDING, Inches(0.5))
+    IDFS_MARGIN = Inches(0.05)
+    BOX_LINE_WIDTH = Pt(1)
+    CURVE_LINE_WIDTH = Pt(2)
+    CHART_LINE_WIDTH = Pt(0.5)
+    PARAGRAPH_SPACING = Pt(2)
+
+    # Parsed default template shared by all instances (see _get_template)
+    _TEMPLATE = None
+
+    # Pre-parsed fill/border elements keyed by (fill, border, line width), see _set_fill_and_border
+    _STYLE_CACHE: Dict = {}
+
+    def __init__(self, article_data: Dict[str, str], icon_type: str = 'medical', verbose: bool = False,
+                 prs: Optional[Presentation] = None, decorative: bool = True):
         self.data = article_data
         self.icon_type = icon_type
         self.verbose = verbose
-        self.prs = Presentation()
+        # False skips the hard-coded survival curves/legend (no article data) for batch runs
+        self.decorative = decorative
+        self.prs = prs if prs is not None else copy.deepcopy(self._get_template())
+        self._finding_cache = self._parse_finding_1()
+
+    def _parse_finding_1(self) -> Dict:
+        """Split finding_1 once into the text before the iDFS block and the iDFS lines"""
+        finding_content = self.data.get('finding_1', '')
+
+        # The iDFS block starts at the first line holding a marker
+        markers = [pos for pos in (finding_content.find('iDFS'), finding_content.find('Ribociclib + NSAI:')) if pos >= 0]
+        cut = finding_content.rfind('\n', 0, min(markers)) + 1 if markers else len(finding_content)
+
+        main_text = [stripped for line in finding_content[:cut].split('\n') if (stripped := line.strip())]
+        idfs_lines = []
+        if cut < len(finding_content):
+            idfs_lines = [stripped for line in finding_content[cut:].split('\n')
+                          if (stripped := line.strip()) and not stripped.startswith('iDFS')]
+
+        return {'main': ' '.join(main_text), 'idfs_lines': idfs_lines}
+
+    @classmethod
+    def from_template(cls, prs: Presentation, article_data: Dict[str, str],
+                      icon_type: str = 'medical', verbose: bool = False, decorative: bool = True):
+        """Generator that adds its slide to an already loaded presentation (e.g. one deck per batch)"""
+        return cls(article_data, icon_type, verbose, prs=prs, decorative=decorative)
+
+    @classmethod
+    def _get_template(cls) -> Presentation:
+        """Empty sized presentation, built once and deep-copied per generator"""
+        if cls._TEMPLATE is None:
+            template = Presentation()
+
+            # Set slide dimensions
+            template.slide_width = Inches(cls.SLIDE_WIDTH)
+            template.slide_height = Inches(cls.SLIDE_HEIGHT)
+
+            cls._add_layout_boxes(template.slide_layouts[6])
+            cls._TEMPLATE = template
+        return cls._TEMPLATE
+
+    @classmethod
+    def _add_layout_boxes(cls, layout):
+        """
+        Draw the four left box backgrounds and their icons on the blank layout
+        Every slide inherits them, so a deck stores them once instead of once per slide
+        """
+        sp_tree = layout.shapes._spTree
+        for index, (box_title, _, left, top, width, height) in enumerate(cls._BOX_SPECS, 1):
+            box = sp_tree.add_autoshape(
+                sp_tree.max_shape_id + 1, f"{cls.LAYOUT_BOX_NAME} {index}", 'rect',
+                Inches(left), Inches(top), Inches(width), Inches(height)
+            )
+            cls._set_fill_and_border(box, cls.COLORS['box_background'], cls.COLORS['box_border'], cls.BOX_LINE_WIDTH)
+
+            png = cls._icon_png(box_title)
+            if png is not None:
+                image_part, rId = layout.part.get_or_add_image_part(BytesIO(png))
+                sp_tree.add_pic(
+                    sp_tree.max_shape_id + 1, f"{cls.LAYOUT_BOX_NAME} Icon {index}", image_part.desc, rId,
+                    *cls._icon_rect(box_title, left, top)
+                )
 
-        # Set slide dimensions
-        self.prs.slide_width = Inches(self.SLIDE_WIDTH)
-        self.prs.slide_height = Inches(self.SLIDE_HEIGHT)
+    def _layout_has_boxes(self, layout) -> bool:
+        """True if the layout already carries the box backgrounds (see _add_layout_boxes)"""
+        return any(shape.name.startswith(self.LAYOUT_BOX_NAME) for shape in layout.shapes)
 
     def generate(self, output_path: str):
         """Generate PowerPoint presentation"""
+        stream = self.generate_to_stream()
+
+        # The deck is zipped in memory, then written to disk in one buffered write
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(stream.getbuffer())
+
+        if self.verbose:
+            print(f"✅ JAMA Oncology PowerPoint kaydedildi: {output_path}")
+
+    def generate_to_stream(self) -> BytesIO:
+        """Generate the presentation in memory, e.g. for HTTP/S3 consumers that need no file"""
         if self.verbose:
             print("📝 JAMA Oncology PowerPoint oluşturuluyor...")
 
         # Add blank slide
         blank_slide_layout = self.prs.slide_layouts[6]
         slide = self.prs.slides.add_slide(blank_slide_layout)
+        self._boxes_on_layout = self._layout_has_boxes(blank_slide_layout)
+
+        # Cache the max shape id so each add_* doesn't rescan every id on the slide
+        # (only this one Slide object touches the slide, so ids cannot collide)
+        slide.shapes.turbo_add_enabled = True
 
         # Set white background
         background = slide.background
         fill = background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor(255, 255, 255)
+        fill.fore_color.rgb = self.COLORS['slide_bg']
 
         # Add GREEN header bar
         self._add_header(slide)
@@ -104,25 +360,9 @@ class JAMAOncologyPowerPointGenerator:
         # Add main title
         self._add_main_title(slide)
 
-        # SOL TARAF - Üst sıra (2 kutu)
-        self._add_content_box(
-            slide, "POPULATION", self.data.get('population', 'N/A'),
-            self.LEFT_COL1_X, self.TOP_ROW_Y, self.LEFT_BOX_WIDTH, self.LEFT_BOX_HEIGHT
-        )
-        self._add_content_box(
-            slide, "INTERVENTION", self.data.get('intervention', 'N/A'),
-            self.LEFT_COL2_X, self.TOP_ROW_Y, self.LEFT_BOX_WIDTH, self.LEFT_BOX_HEIGHT
-        )
-
-        # SOL TARAF - Alt sıra (2 kutu)
-        self._add_content_box(
-            slide, "SETTINGS / LOCATIONS", self.data.get('setting', 'N/A'),
-            self.LEFT_COL1_X, self.BOTTOM_ROW_Y, self.LEFT_BOX_WIDTH, self.LEFT_BOX_HEIGHT
-        )
-        self._add_content_box(
-            slide, "PRIMARY OUTCOME", self.data.get('primary_outcome', 'N/A'),
-            self.LEFT_COL2_X, self.BOTTOM_ROW_Y, self.LEFT_BOX_WIDTH, self.LEFT_BOX_HEIGHT
-        )
+        # SOL TARAF - 2x2 kutu (üst sıra, alt sıra)
+        for box_title, key, left, top, width, height in self._BOX_SPECS:
+            self._add_content_box(slide, box_title, self.data.get(key, self.MISSING_TEXT), left, top, width, height)
 
         # SAĞ TARAF - 1 BÜYÜK FINDINGS kutusu (grafik + iDFS)
         self._add_findings_box(slide)
@@ -131,34 +371,24 @@ class JAMAOncologyPowerPointGenerator:
         self._add_footer(slide)
 
         # Save presentation
-        self.prs.save(output_path)
-
-        if self.verbose:
-            print(f"✅ JAMA Oncology PowerPoint kaydedildi: {output_path}")
+        stream = BytesIO()
+        self.prs.save(stream)
+        stream.seek(0)
+        return stream
 
     def _add_header(self, slide):
         """Add GREEN header bar with JAMA Oncology branding"""
         # Header background
-        left = Inches(0)
-        top = Inches(0)
-        width = Inches(self.SLIDE_WIDTH)
-        height = Inches(self.HEADER_HEIGHT)
-
         header_box = slide.shapes.add_shape(
             1,  # Rectangle
-            left, top, width, height
+            *self.HEADER_RECT
         )
         header_box.fill.solid()
         header_box.fill.fore_color.rgb = self.COLORS['header_bg']
         header_box.line.fill.background()
 
         # Add "JAMA Oncology" text
-        logo_left = Inches(self.LOGO_LEFT)
-        logo_top = Inches(self.LOGO_TOP + 0.05)
-        logo_width = Inches(self.LOGO_WIDTH)
-        logo_height = Inches(self.LOGO_HEIGHT)
-
-        logo_textbox = slide.shapes.add_textbox(logo_left, logo_top, logo_width, logo_height)
+        logo_textbox = slide.shapes.add_textbox(*self.LOGO_RECT)
         text_frame = logo_textbox.text_frame
         text_frame.vertical_anchor = MSO_ANCHOR.TOP
 
@@ -168,10 +398,7 @@ class JAMAOncologyPowerPointGenerator:
         p1.alignment = PP_ALIGN.LEFT
         p1.space_after = Pt(0)
         run1 = p1.runs[0]
-        run1.font.size = Pt(22)
-        run1.font.bold = False
-        run1.font.color.rgb = RGBColor(255, 255, 255)
-        run1.font.name = "Arial"
+        self._style_run(run1, Pt(22), self.COLORS['title_text'], bold=False)
 
     def _add_main_title(self, slide):
         """Add main article title with RCT prefix - auto-size based on length"""
@@ -181,23 +408,9 @@ class JAMAOncologyPowerPointGenerator:
         study_type = "RCT:"  # Default for oncology trials
 
         # Font size based on title length - OKUNABILIR KALSIN
-        if len(title) > 150:
-            font_size = 14
-        elif len(title) > 120:
-            font_size = 15
-        elif len(title) > 100:
-            font_size = 16
-        elif len(title) > 70:
-            font_size = 18
-        else:
-            font_size = 20
-
-        left = Inches(self.TITLE_LEFT)
-        top = Inches(self.TITLE_TOP)
-        width = Inches(self.TITLE_WIDTH)
-        height = Inches(self.TITLE_HEIGHT)
+        font_size = self.TITLE_FONT_SIZES[bisect_left(self.TITLE_LENGTH_LIMITS, len(title))]
 
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*self.TITLE_RECT)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
         text_frame.vertical_anchor = MSO_ANCHOR.TOP
@@ -206,31 +419,24 @@ class JAMAOncologyPowerPointGenerator:
         p.alignment = PP_ALIGN.LEFT
         p.space_after = Pt(0)
 
-        # Study type in GREEN - VURGULU
-        run1 = p.add_run()
-        run1.text = f"{study_type} "
-        run1.font.bold = True
-        run1.font.size = Pt(font_size)
-        run1.font.color.rgb = self.COLORS['accent']
-        run1.font.name = "Arial"
-
-        # Rest of title in black - BOLD
-        run2 = p.add_run()
-        run2.text = title
-        run2.font.bold = True
-        run2.font.size = Pt(font_size)
-        run2.font.color.rgb = RGBColor(0, 0, 0)
-        run2.font.name = "Arial"
+        font_size = Pt(font_size)
+
+        self._append_runs(p, [
+            # Study type in GREEN - VURGULU
+            _run_xml(f"{study_type} ", font_size, self.COLORS['accent'], bold=True),
+            # Rest of title in black - BOLD
+            _run_xml(title, font_size, self.COLORS['title_body'], bold=True),
+        ])
 
     def _add_content_box(self, slide, box_title: str, content: str,
                          left_pos: float, top_pos: float,
                          box_width: float, box_height: float,
                          add_chart: bool = False):
         """Add content box with title and content"""
-        left = Inches(left_pos)
-        top = Inches(top_pos)
-        width = Inches(box_width)
-        height = Inches(box_height)
+        left = _emu(left_pos)
+        top = _emu(top_pos)
+        width = _emu(box_width)
+        height = _emu(box_height)
 
         # Create box shape
         box = slide.shapes.add_shape(
@@ -238,14 +444,16 @@ class JAMAOncologyPowerPointGenerator:
             left, top, width, height
         )
 
-        # Format box
-        box.fill.solid()
-        box.fill.fore_color.rgb = self.COLORS['box_background']
-        box.line.color.rgb = RGBColor(200, 200, 200)
-        box.line.width = Pt(1)
+        if self._boxes_on_layout:
+            # Background and icon come from the slide layout; this shape only carries the text
+            box.fill.background()
+            box.line.fill.background()
+        else:
+            # Format box
+            self._set_fill_and_border(box._element, self.COLORS['box_background'], self.COLORS['box_border'], self.BOX_LINE_WIDTH)
 
-        # Add icon based on box type
-        self._add_oncology_icon(slide, box_title, left_pos, top_pos)
+            # Add icon based on box type
+            self._add_oncology_icon(slide, box_title, left_pos, top_pos)
 
         # Try to add chart if requested
         chart_added = False
@@ -257,10 +465,8 @@ class JAMAOncologyPowerPointGenerator:
         text_frame = box.text_frame
         text_frame.word_wrap = True
         # More space for icon at top
-        text_frame.margin_top = Inches(0.7)  # Space for icon
-        text_frame.margin_bottom = Inches(0.1)
-        text_frame.margin_left = Inches(0.15)
-        text_frame.margin_right = Inches(0.15)
+        (text_frame.margin_top, text_frame.margin_bottom,
+         text_frame.margin_left, text_frame.margin_right) = self.BOX_MARGINS
 
         # Clear default paragraph
         text_frame.clear()
@@ -271,10 +477,7 @@ class JAMAOncologyPowerPointGenerator:
         title_p.alignment = PP_ALIGN.LEFT
         title_p.space_after = Pt(6)
         title_run = title_p.runs[0]
-        title_run.font.bold = True
-        title_run.font.size = Pt(9)
-        title_run.font.color.rgb = self.COLORS['box_title']
-        title_run.font.name = "Arial"
+        self._style_run(title_run, Pt(9), self.COLORS['box_title'], bold=True)
 
         # Add formatted content
         self._add_formatted_content(text_frame, content, box_title)
@@ -282,63 +485,73 @@ class JAMAOncologyPowerPointGenerator:
     def _add_formatted_content(self, text_frame, content: str, box_title: str):
         """Add formatted content with GREEN highlights for numbers - KELIME SINIRI UYGULANIR"""
 
-        # Kelime limitleri - SENİN BELİRLEDİĞİN
-        word_limits = {
-            'POPULATION': 15,
-            'INTERVENTION': 15,
-            'SETTINGS / LOCATIONS': 10,
-            'PRIMARY OUTCOME': 20,
-            'FINDINGS': 15  # Her findings için
-        }
+        # Missing data: no truncation, sizing or number scan (blank lines are skipped anyway)
+        if not content or content.isspace():
+            return
+        if content == self.MISSING_TEXT:
+            self._append_paragraphs(text_frame, [_PARAGRAPH_XML.format(
+                space_after=self.PARAGRAPH_SPACING.centipoints,
+                runs=_run_xml(content, Pt(10), self.COLORS['box_content'])
+            )])
+            return
 
-        word_limit = word_limits.get(box_title, 20)
+        word_limit = self.WORD_LIMITS.get(box_title, self.DEFAULT_WORD_LIMIT)
 
         # İçeriği kelime limitine göre kısalt
+        # (truncation joins the lines, so the result is always one non-blank paragraph)
         content = self._truncate_to_word_limit(content, word_limit)
 
-        lines = content.split('\n')
-        total_words = sum(len(line.split()) for line in lines if line.strip())
-
         # Font boyutu - kelime sayısına göre
-        if total_words > word_limit * 0.8:
+        if word_count(content) > word_limit * 0.8:
             base_font_size = 9
         else:
             base_font_size = 10
 
-        for line in lines:
-            if not line.strip():
-                continue
-
-            # Capitalize first letter
-            line = line[0].upper() + line[1:] if line else line
-
-            p = text_frame.add_paragraph()
-            p.alignment = PP_ALIGN.LEFT
-            p.space_after = Pt(2)
-
-            # Highlight numbers in GREEN (like reference image)
-            if re.search(r'\d+', line):
-                parts = re.split(r'(\d+\.?\d*)', line)
-                for part in parts:
-                    if part.strip():
-                        run = p.add_run()
-                        run.text = part
-                        run.font.name = "Arial"
-
-                        # Numbers in GREEN and bold - VURGULU
-                        if re.match(r'\d+\.?\d*$', part):
-                            run.font.color.rgb = self.COLORS['accent']
-                            run.font.bold = True
-                            run.font.size = Pt(base_font_size + 1)
-                        else:
-                            run.font.color.rgb = self.COLORS['box_content']
-                            run.font.size = Pt(base_font_size)
-            else:
-                run = p.add_run()
-                run.text = line
-                run.font.name = "Arial"
-                run.font.color.rgb = self.COLORS['box_content']
-                run.font.size = Pt(base_font_size)
+        text_size = Pt(base_font_size)
+        number_size = Pt(base_font_size + 1)
+
+        # Capitalize first letter
+        line = content[0].upper() + content[1:]
+
+        # Highlight numbers in GREEN (like reference image)
+        self._append_paragraphs(text_frame, [self._highlighted_paragraph_xml(line, text_size, number_size)])
+
+    def _highlighted_paragraph_xml(self, line: str, text_size, number_size) -> str:
+        """<a:p> XML for a line, numbers in GREEN and bold - one tokenizer pass"""
+        # Colors resolved once per line instead of two lookups per run
+        text_color = self.COLORS['box_content']
+        number_color = self.COLORS['accent']
+        runs = []
+        last = 0
+        for match in _find_numbers(line):
+            gap = line[last:match.start()]
+            if gap.strip():
+                runs.append(_run_xml(gap, text_size, text_color))
+            runs.append(_run_xml(match.group(), number_size, number_color, bold=True))
+            last = match.end()
+        if line[last:].strip():
+            runs.append(_run_xml(line[last:], text_size, text_color))
+        return _PARAGRAPH_XML.format(space_after=self.PARAGRAPH_SPACING.centipoints, runs=''.join(runs))
+
+    def _style_run(self, run, size, color: RGBColor, bold: Optional[bool] = None):
+        """Arial run styling through a single Font proxy (bold, size, color, name)"""
+        font = run.font
+        if bold is not None:
+            font.bold = bold
+        font.size = size
+        font.color.rgb = color
+        font.name = "Arial"
+
+    def _append_runs(self, paragraph, runs_xml):
+        """Parse run XML fragments in one go and append them to the paragraph"""
+        fragment = parse_xml(f'<a:p {nsdecls("a")}>{"".join(runs_xml)}</a:p>')
+        paragraph._p.extend(list(fragment))
+
+    def _append_paragraphs(self, text_frame, paragraphs_xml):
+        """Parse paragraph XML fragments in one go and append them to the text frame"""
+        if paragraphs_xml:
+            fragment = parse_xml(f'<a:txBody {nsdecls("a")}>{"".join(paragraphs_xml)}</a:txBody>')
+            text_frame._txBody.extend(list(fragment))
 
     def _truncate_to_word_limit(self, text: str, word_limit: int) -> str:
         """Metni kelime limitine göre akıllıca kısalt - en önemli bilgileri koru"""
@@ -352,255 +565,134 @@ class JAMAOncologyPowerPointGenerator:
         if len(words) <= word_limit:
             return text
 
-        # AKILLI KISALTMA: Sayıları ve önemli kelimeleri koru
-        important_words = []
-        for word in words:
-            # Sayı içeriyorsa muhakkak al
-            if any(char.isdigit() for char in word):
-                important_words.append(word)
-            # Önemli kelimeler (study, patients, vs, treatment, risk, etc.)
-            elif word.lower() in ['study', 'patients', 'adults', 'randomized', 'treatment',
-                                   'vs', 'compared', 'risk', 'outcome', 'survival', 'age',
-                                   'male', 'female', 'years', 'months', 'therapy', 'trial',
-                                   'cohort', 'retrospective', 'prospective', 'analysis']:
-                important_words.append(word)
-            # Normal kelimeler
-            else:
-                important_words.append(word)
-
-        # Word limit'e kadar al
-        if len(important_words) > word_limit:
-            # Sayı içeren kelimeleri ve ilk kelimeleri önceliklendir
-            result = []
-            # Önce sayılı olanları al
-            for word in important_words:
-                if any(char.isdigit() for char in word) and len(result) < word_limit:
-                    result.append(word)
+        # AKILLI KISALTMA: Sayı içeren kelimeleri ve ilk kelimeleri önceliklendir
+        has_digit = [_has_digit(word) for word in words]
 
-            # Kalan yerleri baştan doldur
-            for word in important_words:
-                if word not in result and len(result) < word_limit:
-                    result.append(word)
+        result = []
+        # Önce sayılı olanları al
+        for word, numeric in zip(words, has_digit):
+            if numeric and len(result) < word_limit:
+                result.append(word)
 
-            return ' '.join(result)
+        # Kalan yerleri baştan doldur (seen: O(1) tekrar kontrolü)
+        seen = set(result)
+        for word in words:
+            if len(result) >= word_limit:
+                break
+            if word not in seen:
+                seen.add(word)
+                result.append(word)
 
-        return ' '.join(important_words[:word_limit])
+        return ' '.join(result)
 
     def _add_oncology_icon(self, slide, box_title: str, left_pos: float, top_pos: float):
         """Add oncology-specific icons - positioned ABOVE title"""
-        icon_size = 0.3
+        png = self._icon_png(box_title)
+        if png is None:
+            return  # FINDINGS: chart will be shown
+
+        slide.shapes.add_picture(BytesIO(png), *self._icon_rect(box_title, left_pos, top_pos))
+
+    @classmethod
+    def _icon_rect(cls, box_title: str, left_pos: float, top_pos: float) -> tuple:
+        """EMU (left, top, width, height) of a box icon picture"""
+        icon_size = cls.ICON_SIZE
 
         # Calculate center position
         if box_title == "FINDINGS":
-            box_width = self.RIGHT_BOX_WIDTH
+            box_width = cls.RIGHT_BOX_WIDTH
         else:
-            box_width = self.LEFT_BOX_WIDTH
+            box_width = cls.LEFT_BOX_WIDTH
 
         icon_left = left_pos + (box_width - icon_size) / 2
         icon_top = top_pos + 0.3  # Lower position to avoid overlap
 
-        if box_title == "POPULATION":
-            self._add_brain_icon(slide, icon_left, icon_top, icon_size)
-        elif box_title == "INTERVENTION":
-            self._add_medication_icon(slide, icon_left, icon_top, icon_size)
-        elif box_title == "FINDINGS":
-            pass  # Chart will be shown
-        elif box_title == "SETTINGS / LOCATIONS":
-            self._add_map_pin_icon(slide, icon_left, icon_top, icon_size)
-        elif box_title == "PRIMARY OUTCOME":
-            self._add_target_icon(slide, icon_left, icon_top, icon_size)
-
-    def _add_brain_icon(self, slide, left: float, top: float, size: float):
-        """Brain/neurology icon - simple circle"""
-        outline_color = RGBColor(0, 0, 0)
-
-        # Brain outline (circle)
-        brain = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left), Inches(top),
-            Inches(size), Inches(size)
-        )
-        brain.fill.background()
-        brain.line.color.rgb = outline_color
-        brain.line.width = Pt(3)
-
-    def _add_target_icon(self, slide, left: float, top: float, size: float):
-        """Target/outcome icon - concentric circles"""
-        outline_color = RGBColor(0, 0, 0)
-
-        # Outer circle
-        outer = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left), Inches(top),
-            Inches(size), Inches(size)
-        )
-        outer.fill.background()
-        outer.line.color.rgb = outline_color
-        outer.line.width = Pt(2)
-
-        # Inner circle
-        inner = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left + size * 0.3), Inches(top + size * 0.3),
-            Inches(size * 0.4), Inches(size * 0.4)
-        )
-        inner.fill.solid()
-        inner.fill.fore_color.rgb = outline_color
-        inner.line.fill.background()
-
-    def _add_breast_cancer_icon(self, slide, left: float, top: float, size: float):
-        """Breast cancer anatomy icon - black outline"""
-        outline_color = RGBColor(0, 0, 0)
-
-        # Breast outline (circle/oval shape)
-        breast = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left + size * 0.15), Inches(top + size * 0.1),
-            Inches(size * 0.7), Inches(size * 0.75)
-        )
-        breast.fill.background()
-        breast.line.color.rgb = outline_color
-        breast.line.width = Pt(3)
-
-        # Tumor indicator (filled dark circle)
-        tumor = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left + size * 0.25), Inches(top + size * 0.25),
-            Inches(size * 0.2), Inches(size * 0.2)
-        )
-        tumor.fill.solid()
-        tumor.fill.fore_color.rgb = outline_color
-        tumor.line.fill.background()
-
-        # Radiation/warning lines
-        for i in range(3):
-            angle_offset = i * 0.08
-            line = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(left + size * 0.75 + angle_offset), Inches(top + size * 0.15 + i * 0.06),
-                Inches(size * 0.12), Inches(size * 0.02)
-            )
-            line.fill.solid()
-            line.fill.fore_color.rgb = outline_color
-            line.line.fill.background()
-
-    def _add_medication_icon(self, slide, left: float, top: float, size: float):
-        """Medication pills icon - outline with division line"""
-        outline_color = RGBColor(0, 0, 0)
-
-        # Two pills side by side
-        pill_positions = [0, 0.5]
-
-        for i, x_offset in enumerate(pill_positions):
-            # Pill oval
-            pill = slide.shapes.add_shape(
-                MSO_SHAPE.OVAL,
-                Inches(left + size * x_offset), Inches(top + size * 0.2),
-                Inches(size * 0.4), Inches(size * 0.6)
-            )
-            pill.fill.background()
-            pill.line.color.rgb = outline_color
-            pill.line.width = Pt(3)
-
-            # Division line in middle of pill
-            divider = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(left + size * (x_offset - 0.05)), Inches(top + size * 0.48),
-                Inches(size * 0.5), Inches(size * 0.04)
-            )
-            divider.fill.solid()
-            divider.fill.fore_color.rgb = outline_color
-            divider.line.fill.background()
-
-    def _add_map_pin_icon(self, slide, left: float, top: float, size: float):
-        """Map location pin icon - outline"""
-        outline_color = RGBColor(0, 0, 0)
-
-        # Pin top (circle)
-        pin_top = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(left + size * 0.25), Inches(top),
-            Inches(size * 0.5), Inches(size * 0.5)
-        )
-        pin_top.fill.background()
-        pin_top.line.color.rgb = outline_color
-        pin_top.line.width = Pt(3)
-
-        # Pin bottom (triangle pointing down)
-        # Using rectangle rotated as triangle placeholder
-        pin_bottom = slide.shapes.add_shape(
-            MSO_SHAPE.ISOSCELES_TRIANGLE,
-            Inches(left + size * 0.3), Inches(top + size * 0.45),
-            Inches(size * 0.4), Inches(size * 0.5)
-        )
-        pin_bottom.fill.background()
-        pin_bottom.line.color.rgb = outline_color
-        pin_bottom.line.width = Pt(3)
+        # The PNG has a transparent margin for the outline half outside the shape edge
+        margin = icon_size * _ICON_MARGIN
+        return (_emu(icon_left - margin), _emu(icon_top - margin),
+                _emu(icon_size + 2 * margin), _emu(icon_size + 2 * margin))
+
+    @classmethod
+    def _icon_png(cls, box_title: str) -> Optional[bytes]:
+        """PNG bytes of a box icon, drawn once with PIL and cached"""
+        if box_title not in cls.ICON_SHAPES:
+            return None
+        png = _ICON_PNG_CACHE.get(box_title)
+        if png is None:
+            png = _ICON_PNG_CACHE[box_title] = cls._render_icon(box_title)
+        return png
+
+    @classmethod
+    def _render_icon(cls, box_title: str) -> bytes:
+        """Draw an icon supersampled, then downscale for smooth edges"""
+        side = _ICON_PX * _ICON_SUPERSAMPLE
+        img = Image.new('RGBA', (side, side), (255, 255, 255, 0))
+        draw = ImageDraw.Draw(img)
+        color = (*cls.COLORS['icon'], 255)
+        scale = side / (1 + 2 * _ICON_MARGIN)
+
+        for kind, (x0, y0, x1, y1), line_pt in cls.ICON_SHAPES[box_title]:
+            box = [(x0 + _ICON_MARGIN) * scale, (y0 + _ICON_MARGIN) * scale,
+                   (x1 + _ICON_MARGIN) * scale, (y1 + _ICON_MARGIN) * scale]
+
+            if line_pt is None:
+                fill, outline, width = color, None, 0
+            else:
+                # PowerPoint centres outlines on the shape edge, PIL strokes inwards
+                width = round(line_pt / (cls.ICON_SIZE * 72) * scale)
+                box = [box[0] - width / 2, box[1] - width / 2, box[2] + width / 2, box[3] + width / 2]
+                fill, outline = None, color
+
+            if kind == 'oval':
+                draw.ellipse(box, fill=fill, outline=outline, width=width)
+            elif kind == 'rect':
+                draw.rectangle(box, fill=fill, outline=outline, width=width)
+            elif kind == 'triangle':
+                points = [((box[0] + box[2]) / 2, box[1]), (box[2], box[3]), (box[0], box[3])]
+                draw.polygon(points, fill=fill, outline=outline, width=width)
+
+        img = img.resize((_ICON_PX, _ICON_PX), Image.LANCZOS)
+        buf = BytesIO()
+        img.save(buf, format='PNG')
+        return buf.getvalue()
 
     def _add_findings_box(self, slide):
         """Add FINDINGS box with chart and iDFS results - like reference image"""
-        left = Inches(self.RIGHT_BOX_X)
-        top = Inches(self.RIGHT_BOX_Y)
-        width = Inches(self.RIGHT_BOX_WIDTH)
-        height = Inches(self.RIGHT_BOX_HEIGHT)
+        left, top, width, height = self.FINDINGS_RECT
 
         # Create main box (BG only - NO TEXT FRAME)
-        box = slide.shapes.add_shape(1, left, top, width, height)
-        box.fill.solid()
-        box.fill.fore_color.rgb = self.COLORS['box_background']
-        box.line.color.rgb = RGBColor(200, 200, 200)
-        box.line.width = Pt(1)
+        self._bulk_append_shapes(slide, [self._shape_xml(
+            slide, _RECT_XML, left, top, width, height,
+            style=_FILL_AND_BORDER_XML.format(fill=self.COLORS['box_background'], border=self.COLORS['box_border'],
+                                              width=self.BOX_LINE_WIDTH)
+        )])
 
         # Add FINDINGS title as separate textbox
-        title_box = slide.shapes.add_textbox(
-            left + Inches(0.15),
-            top + Inches(0.12),
-            width - Inches(0.3),
-            Inches(0.25)
-        )
+        title_box = slide.shapes.add_textbox(*self.FINDINGS_TITLE_RECT)
         title_frame = title_box.text_frame
         title_p = title_frame.paragraphs[0]
         title_p.text = "FINDINGS"
         title_p.alignment = PP_ALIGN.LEFT
         title_run = title_p.runs[0]
-        title_run.font.bold = True
-        title_run.font.size = Pt(10)
-        title_run.font.color.rgb = self.COLORS['box_title']
-        title_run.font.name = "Arial"
+        self._style_run(title_run, Pt(10), self.COLORS['box_title'], bold=True)
 
         # Add main finding content (text before chart) as separate textbox - MAX 15 KELIME
-        finding_content = self.data.get('finding_1', '')
-        if finding_content:
-            # Get text before "iDFS" section
-            content_lines = finding_content.split('\n')
-            main_text = []
-            for line in content_lines:
-                if 'iDFS' in line or 'Ribociclib + NSAI:' in line:
-                    break
-                if line.strip():
-                    main_text.append(line.strip())
-
-            main_content = ' '.join(main_text).strip()
+        if self.data.get('finding_1', ''):
+            # Text before "iDFS" section, parsed once in __init__
+            main_content = self._finding_cache['main']
 
             # Kelime limitine göre kısalt (max 15 kelime)
-            main_content = self._truncate_to_word_limit(main_content, 15)
+            main_content = self._truncate_to_word_limit(main_content, self.WORD_LIMITS['FINDINGS'])
 
             if main_content:
-                content_box = slide.shapes.add_textbox(
-                    left + Inches(0.15),
-                    top + Inches(0.45),
-                    width - Inches(0.3),
-                    Inches(0.5)
-                )
+                content_box = slide.shapes.add_textbox(*self.FINDINGS_TEXT_RECT)
                 content_frame = content_box.text_frame
                 content_frame.word_wrap = True
                 content_p = content_frame.paragraphs[0]
                 content_p.text = main_content
                 content_p.alignment = PP_ALIGN.LEFT
                 run = content_p.runs[0]
-                run.font.size = Pt(8)
-                run.font.color.rgb = self.COLORS['box_content']
-                run.font.name = "Arial"
+                self._style_run(run, Pt(8), self.COLORS['box_content'])
 
         # Add survival curve placeholder (chart area)
         chart_left = self.RIGHT_BOX_X + 0.25
@@ -619,17 +711,21 @@ class JAMAOncologyPowerPointGenerator:
     def _add_survival_curve_placeholder(self, slide, left: float, top: float, width: float, height: float):
         """Add survival curve chart placeholder with visual representation"""
 
-        chart_left = Inches(left)
-        chart_top = Inches(top)
-        chart_width = Inches(width)
-        chart_height = Inches(height)
+        chart_left = _emu(left)
+        chart_top = _emu(top)
+        chart_width = _emu(width)
+        chart_height = _emu(height)
 
         # Add white background for chart area
-        chart_bg = slide.shapes.add_shape(1, chart_left, chart_top, chart_width, chart_height)
-        chart_bg.fill.solid()
-        chart_bg.fill.fore_color.rgb = RGBColor(255, 255, 255)
-        chart_bg.line.color.rgb = RGBColor(220, 220, 220)
-        chart_bg.line.width = Pt(0.5)
+        chart_bg = self._shape_xml(
+            slide, _RECT_XML, chart_left, chart_top, chart_width, chart_height,
+            style=_FILL_AND_BORDER_XML.format(fill=self.COLORS['chart_bg'], border=self.COLORS['chart_border'],
+                                              width=self.CHART_LINE_WIDTH)
+        )
+
+        if not self.decorative:
+            self._bulk_append_shapes(slide, [chart_bg])
+            return
 
         # Draw two survival curves (green lines representing treatment groups)
         # Line 1: Ribociclib+NSAI (higher survival - top line)
@@ -642,17 +738,6 @@ class JAMAOncologyPowerPointGenerator:
             (left + 2.8, top + 0.6)
         ]
 
-        for i in range(len(line1_points) - 1):
-            x1, y1 = line1_points[i]
-            x2, y2 = line1_points[i + 1]
-            connector = slide.shapes.add_connector(
-                1,  # Straight line
-                Inches(x1), Inches(y1),
-                Inches(x2), Inches(y2)
-            )
-            connector.line.color.rgb = self.COLORS['accent']  # Green
-            connector.line.width = Pt(2)
-
         # Line 2: NSAI alone (lower survival - bottom line)
         line2_points = [
             (left + 0.3, top + 0.4),
@@ -663,77 +748,76 @@ class JAMAOncologyPowerPointGenerator:
             (left + 2.8, top + 1.0)
         ]
 
-        for i in range(len(line2_points) - 1):
-            x1, y1 = line2_points[i]
-            x2, y2 = line2_points[i + 1]
-            connector = slide.shapes.add_connector(
-                1,  # Straight line
-                Inches(x1), Inches(y1),
-                Inches(x2), Inches(y2)
-            )
-            connector.line.color.rgb = RGBColor(128, 128, 128)  # Gray
-            connector.line.width = Pt(2)
-
-        # Add legend
+        # Background, curves and legend go in as one batch: each curve is an open freeform polyline
+        # instead of five connectors, and the legend shapes are built from XML templates
         legend_y = top + 0.15
-
-        # Green line for Ribociclib+NSAI
-        legend_line1 = slide.shapes.add_shape(
-            1,  # Rectangle
-            chart_left + Inches(2.0), Inches(legend_y),
-            Inches(0.2), Inches(0.02)
-        )
-        legend_line1.fill.solid()
-        legend_line1.fill.fore_color.rgb = self.COLORS['accent']
-        legend_line1.line.fill.background()
-
-        legend_text1 = slide.shapes.add_textbox(
-            chart_left + Inches(2.25), Inches(legend_y - 0.08),
-            Inches(0.8), Inches(0.15)
+        legend_left = chart_left + _emu(2.0)
+        label_left = chart_left + _emu(2.25)
+        self._bulk_append_shapes(slide, [
+            chart_bg,
+            self._polyline_xml(slide, line1_points, self.COLORS['accent'], self.CURVE_LINE_WIDTH),
+            self._polyline_xml(slide, line2_points, self.COLORS['control_line'], self.CURVE_LINE_WIDTH),
+            # Green line for Ribociclib+NSAI
+            self._shape_xml(slide, _RECT_XML, legend_left, _emu(legend_y), _emu(0.2), _emu(0.02),
+                            style=_FILL_NO_LINE_XML.format(fill=self.COLORS['accent'])),
+            self._shape_xml(slide, _LABEL_XML, label_left, _emu(legend_y - 0.08), _emu(0.8), _emu(0.15),
+                            run=_run_xml("Ribociclib+NSAI", Pt(6), self.COLORS['legend_text'])),
+            # Gray line for NSAI alone
+            self._shape_xml(slide, _RECT_XML, legend_left, _emu(legend_y + 0.15), _emu(0.2), _emu(0.02),
+                            style=_FILL_NO_LINE_XML.format(fill=self.COLORS['control_line'])),
+            self._shape_xml(slide, _LABEL_XML, label_left, _emu(legend_y + 0.07), _emu(0.6), _emu(0.15),
+                            run=_run_xml("NSAI alone", Pt(6), self.COLORS['legend_text'])),
+        ])
+
+    def _polyline_xml(self, slide, points, color: RGBColor, line_width) -> str:
+        """Open freeform XML through (x, y) points given in inches"""
+        # O(1) with turbo-add on; build_freeform() would bypass the cached id counter
+        shape_id = slide.shapes._next_shape_id
+        xs = [_emu(x) for x, _ in points]
+        ys = [_emu(y) for _, y in points]
+        left, top = min(xs), min(ys)
+        path = ''.join(
+            _PATH_POINT_XML.format(op='lnTo' if i else 'moveTo', x=x - left, y=y - top)
+            for i, (x, y) in enumerate(zip(xs, ys))
         )
-        legend_frame1 = legend_text1.text_frame
-        legend_p1 = legend_frame1.paragraphs[0]
-        legend_p1.text = "Ribociclib+NSAI"
-        run1 = legend_p1.runs[0]
-        run1.font.size = Pt(6)
-        run1.font.color.rgb = RGBColor(60, 60, 60)
-        run1.font.name = "Arial"
-
-        # Gray line for NSAI alone
-        legend_line2 = slide.shapes.add_shape(
-            1,  # Rectangle
-            chart_left + Inches(2.0), Inches(legend_y + 0.15),
-            Inches(0.2), Inches(0.02)
+        return _POLYLINE_XML.format(
+            id=shape_id, index=shape_id - 1, x=left, y=top, cx=max(xs) - left, cy=max(ys) - top,
+            path=path, width=line_width, color=color
         )
-        legend_line2.fill.solid()
-        legend_line2.fill.fore_color.rgb = RGBColor(128, 128, 128)
-        legend_line2.line.fill.background()
 
-        legend_text2 = slide.shapes.add_textbox(
-            chart_left + Inches(2.25), Inches(legend_y + 0.07),
-            Inches(0.6), Inches(0.15)
-        )
-        legend_frame2 = legend_text2.text_frame
-        legend_p2 = legend_frame2.paragraphs[0]
-        legend_p2.text = "NSAI alone"
-        run2 = legend_p2.runs[0]
-        run2.font.size = Pt(6)
-        run2.font.color.rgb = RGBColor(60, 60, 60)
-        run2.font.name = "Arial"
+    def _shape_xml(self, slide, template: str, left: int, top: int, width: int, height: int, **fields) -> str:
+        """Fill a shape XML template with the next shape id and an EMU rectangle"""
+        shape_id = slide.shapes._next_shape_id
+        return template.format(id=shape_id, index=shape_id - 1, x=left, y=top, cx=width, cy=height, **fields)
+
+    def _bulk_append_shapes(self, slide, xml_fragments):
+        """Parse shape XML fragments in one go and append them to the slide's shape tree"""
+        fragment = parse_xml(f'<p:spTree {nsdecls("a", "p")}>{"".join(xml_fragments)}</p:spTree>')
+        slide.shapes._spTree.extend(list(fragment))
+
+    @classmethod
+    def _set_fill_and_border(cls, sp, fill: RGBColor, border: RGBColor, line_width):
+        """Solid fill plus outline on a <p:sp>, copied from a pre-parsed <a:solidFill>/<a:ln> pair per style"""
+        key = (fill, border, line_width)
+        style = cls._STYLE_CACHE.get(key)
+        if style is None:
+            style_xml = _FILL_AND_BORDER_XML.format(fill=fill, border=border, width=line_width)
+            style = cls._STYLE_CACHE[key] = parse_xml(f'<p:spPr {nsdecls("a", "p")}>{style_xml}</p:spPr>')
+        sp.spPr.extend(copy.deepcopy(list(style)))
 
     def _add_idfs_results(self, slide, left: float, top: float, width: float, height: float):
         """Add iDFS results section below chart"""
-        left_pos = Inches(left)
-        top_pos = Inches(top)
-        width_dim = Inches(width)
-        height_dim = Inches(height)
+        left_pos = _emu(left)
+        top_pos = _emu(top)
+        width_dim = _emu(width)
+        height_dim = _emu(height)
 
         # Create text box (no background, just text)
         textbox = slide.shapes.add_textbox(left_pos, top_pos, width_dim, height_dim)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
-        text_frame.margin_top = Inches(0.05)
-        text_frame.margin_left = Inches(0.05)
+        text_frame.margin_top = self.IDFS_MARGIN
+        text_frame.margin_left = self.IDFS_MARGIN
         text_frame.clear()
 
         # Title
@@ -742,22 +826,10 @@ class JAMAOncologyPowerPointGenerator:
         title_p.alignment = PP_ALIGN.LEFT
         title_p.space_after = Pt(4)
         title_run = title_p.runs[0]
-        title_run.font.bold = True
-        title_run.font.size = Pt(9)
-        title_run.font.color.rgb = self.COLORS['box_title']
-        title_run.font.name = "Arial"
+        self._style_run(title_run, Pt(9), self.COLORS['box_title'], bold=True)
 
-        # Get iDFS data from finding_1
-        finding_content = self.data.get('finding_1', '')
-        idfs_lines = []
-        capture = False
-
-        for line in finding_content.split('\n'):
-            if 'iDFS' in line or 'Ribociclib + NSAI:' in line:
-                capture = True
-            if capture and line.strip():
-                if not line.strip().startswith('iDFS'):
-                    idfs_lines.append(line.strip())
+        # iDFS data from finding_1, parsed once in __init__
+        idfs_lines = self._finding_cache['idfs_lines']
 
         # If no iDFS data found, use default
         if not idfs_lines:
@@ -767,38 +839,11 @@ class JAMAOncologyPowerPointGenerator:
                 'Hazard ratio: 0.72; 95% CI, 0.61-0.84'
             ]
 
-        # Add iDFS results with number highlighting
-        for line in idfs_lines:
-            if not line.strip():
-                continue
-
-            p = text_frame.add_paragraph()
-            p.alignment = PP_ALIGN.LEFT
-            p.space_after = Pt(2)
-
-            # Highlight numbers in green
-            if re.search(r'\d+', line):
-                parts = re.split(r'(\d+\.?\d*)', line)
-                for part in parts:
-                    if part.strip():
-                        run = p.add_run()
-                        run.text = part
-                        run.font.name = "Arial"
-
-                        # Numbers in green and bold
-                        if re.match(r'\d+\.?\d*$', part):
-                            run.font.color.rgb = self.COLORS['accent']
-                            run.font.bold = True
-                            run.font.size = Pt(9)
-                        else:
-                            run.font.color.rgb = self.COLORS['box_content']
-                            run.font.size = Pt(9)
-            else:
-                run = p.add_run()
-                run.text = line
-                run.font.name = "Arial"
-                run.font.color.rgb = self.COLORS['box_content']
-                run.font.size = Pt(9)
+        # Add iDFS results with number highlighting (lines are already stripped and non-empty)
+        text_size = Pt(9)
+        self._append_paragraphs(text_frame, [
+            self._highlighted_paragraph_xml(line, text_size, text_size) for line in idfs_lines
+        ])
 
     def _add_footer(self, slide):
         """Add footer with citation"""
@@ -807,18 +852,10 @@ class JAMAOncologyPowerPointGenerator:
         pub_date = self.data.get('publication_date', '2025')
         doi = self.data.get('doi', '')
 
-        # Extract year
-        year = pub_date.split()[-1] if pub_date else '2025'
-
         # Create footer text
         footer_text = f"{authors}. {journal}. Published online {pub_date}. doi:10.1001/jamaoncol.{doi} © AMA"
 
-        left = Inches(0.3)
-        top = Inches(self.FOOTER_Y)
-        width = Inches(9.4)
-        height = Inches(self.FOOTER_HEIGHT)
-
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*self.FOOTER_RECT)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
         text_frame.vertical_anchor = MSO_ANCHOR.BOTTOM
@@ -828,6 +865,4 @@ class JAMAOncologyPowerPointGenerator:
         p.alignment = PP_ALIGN.LEFT
 
         run = p.runs[0]
-        run.font.size = Pt(6)
-        run.font.color.rgb = self.COLORS['footer_text']
-        run.font.name = "Arial"
+        self._style_run(run, Pt(6), self.COLORS['footer_text'])
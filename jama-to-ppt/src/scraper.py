@@ -3,28 +3,49 @@ JAMA Network Web Scraper with Multi-Tier Fallback System
 Enhanced with Playwright and Undetected ChromeDriver for bot detection bypass
 """
 
+import asyncio
+import atexit
+import json
+import multiprocessing
+import multiprocessing.util
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-try:
-    import undetected_chromedriver as uc
-    HAS_UC = True
-except:
-    HAS_UC = False
+from cache import ArticleCache, DEFAULT_CACHE_DIR
+from utils import HTML_PARSER
 
 try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
-except:
-    HAS_PLAYWRIGHT = False
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# Browser backends (Playwright, undetected-chromedriver, Selenium) take hundreds of ms to
+# import, so they are imported inside the tier that uses them; availability is probed once
+
+
+@lru_cache(maxsize=None)
+def _has_playwright() -> bool:
+    try:
+        import playwright.sync_api  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _has_uc() -> bool:
+    try:
+        import undetected_chromedriver  # noqa: F401
+        return True
+    except Exception:
+        return False
 
 
 class JAMAScraper:
@@ -32,25 +53,92 @@ class JAMAScraper:
     3-tier fallback web scraping system for JAMA Network articles
     """
 
-    def __init__(self, url: str, verbose: bool = False):
+    REQUEST_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+
+    # Max parallel downloads in scrape_many (also the connection pool size)
+    MAX_WORKERS = 8
+
+    # Element the extractor needs (article title): waited for instead of fixed sleeps
+    CONTENT_SELECTOR = 'article h1'
+    CONTENT_WAIT_MS = 8000
+
+    # Requests the scraper never needs: only the document HTML (and its scripts) is kept
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+    BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net')
+
+    # Rendered pages are trimmed in the browser to what ContentExtractor reads: the <head>
+    # meta/title tags plus the <article> subtree, if any. Only when every meta tag of the
+    # extractor's JAMA fast path is present; otherwise (null) the full page is used.
+    # Never for pages that go to the HTML cache or were asked for whole (see _trim_page)
+    REQUIRED_META_KEYS = ['og:title', 'citation_author', 'citation_publication_date',
+                          'citation_doi', 'citation_abstract']
+    ARTICLE_SUBTREE_JS = """keys => {
+        const hasMeta = key => document.head.querySelector(`meta[name="${key}"], meta[property="${key}"]`);
+        if (!keys.every(hasMeta)) return null;
+        const head = Array.from(document.head.querySelectorAll('meta, title'), el => el.outerHTML).join('');
+        const article = document.querySelector('article');
+        return `<html><head>${head}</head><body>${article ? article.outerHTML : ''}</body></html>`;
+    }"""
+
+    PLAYWRIGHT_ARGS = [
+        '--disable-blink-features=AutomationControlled',
+        '--no-sandbox',
+        '--disable-dev-shm-usage'
+    ]
+
+    # Shared keep-alive client for the requests tier (created lazily, see _get_session)
+    _session = None
+
+    # Per-domain tier history: the last successful method is tried first and methods that
+    # failed this many times in a row are skipped (kept in the cache dir across runs)
+    MAX_CONSECUTIVE_FAILURES = 3
+    # A skipped method is tried again once its last failure is older than this (seconds)
+    FAILURE_RETRY_AFTER = 24 * 60 * 60
+    TIER_STATS_FILE = DEFAULT_CACHE_DIR / 'scrape_tiers.json'
+    _tier_stats = None
+
+    # Shared Playwright driver and headless Chromium, launched on first use and kept
+    # open so later articles only pay for a fresh context (see _get_browser / shutdown)
+    _playwright = None
+    _browser = None
+
+    def __init__(self, url: str, verbose: bool = False, use_cache: bool = True, full_page: bool = False):
         self.url = url
         self.verbose = verbose
+        self.full_page = full_page
         self.html_content = None
         self.successful_method = None
+        self._soup = None
+        self._soup_html = None
+        self._article_root = None
+        self._article_root_html = None
+        self.cache = ArticleCache(url, verbose=verbose) if use_cache else None
 
     def scrape(self) -> str:
         """
         Attempt to scrape using multi-tier fallback system
         Returns HTML content or raises exception
         """
+        if self._load_from_cache():
+            print("✅ Önbellekten yüklendi")
+            return self.html_content
+
         methods = []
 
         # Add Playwright if available (best for bot bypass)
-        if HAS_PLAYWRIGHT:
+        if _has_playwright():
             methods.append(("Playwright (stealth)", self._scrape_with_playwright))
 
         # Add other methods
-        if HAS_UC:
+        if _has_uc():
             methods.append(("Undetected Chrome", self._scrape_with_undetected_chrome))
 
         methods.extend([
@@ -59,67 +147,372 @@ class JAMAScraper:
             ("Selenium (full browser)", self._scrape_with_selenium_full)
         ])
 
-        for method_name, method_func in methods:
+        try:
+            for method_name, method_func in self._order_methods(methods):
+                try:
+                    if self.verbose:
+                        print(f"🔄 Yöntem deneniyor: {method_name}...")
+
+                    self.html_content = method_func()
+
+                    if self.html_content and len(self.html_content) > 500:
+                        self.successful_method = method_name
+                        self._record_attempt(method_name, True)
+                        print(f"✅ Başarılı! ({method_name})")
+                        if self.cache:
+                            self.cache.save_html(self.html_content)
+                        return self.html_content
+                    else:
+                        self._record_attempt(method_name, False)
+                        if self.verbose:
+                            print(f"⚠️ {method_name} yetersiz içerik döndürdü")
+
+                except Exception as e:
+                    self._record_attempt(method_name, False)
+                    if self.verbose:
+                        print(f"❌ {method_name} başarısız: {str(e)}")
+                    continue
+        finally:
+            if self.cache:
+                self._save_tier_stats()
+
+        raise Exception("❌ Tüm yöntemler denendi, makale çekilemedi. URL'yi kontrol edin veya erişim sorunu olabilir.")
+
+    @classmethod
+    def _get_tier_stats(cls) -> Dict[str, Dict]:
+        """
+        {domain: {'preferred': method name, 'failures': {method name: consecutive failures},
+                  'failed_at': {method name: time of the last failure}}}
+        """
+        if cls._tier_stats is None:
             try:
-                if self.verbose:
-                    print(f"🔄 Yöntem deneniyor: {method_name}...")
+                cls._tier_stats = json.loads(cls.TIER_STATS_FILE.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                cls._tier_stats = {}
 
-                self.html_content = method_func()
+        return cls._tier_stats
 
-                if self.html_content and len(self.html_content) > 500:
-                    self.successful_method = method_name
-                    print(f"✅ Başarılı! ({method_name})")
-                    return self.html_content
-                else:
-                    if self.verbose:
-                        print(f"⚠️ {method_name} yetersiz içerik döndürdü")
+    @classmethod
+    def _save_tier_stats(cls):
+        # Like the article cache, a failed write must never break scraping
+        try:
+            cls.TIER_STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            cls.TIER_STATS_FILE.write_text(json.dumps(cls._get_tier_stats(), indent=2), encoding='utf-8')
+        except OSError:
+            pass
+
+    @classmethod
+    def reset_tier_stats(cls, domain: str = None):
+        """Forget the tier history of one domain (or of all domains) so every method is tried again"""
+        stats = cls._get_tier_stats()
+        if domain is None:
+            stats.clear()
+        else:
+            stats.pop(domain, None)
+        cls._save_tier_stats()
+
+    def _domain_stats(self) -> Dict:
+        domain = urlparse(self.url).netloc
+        stats = self._get_tier_stats().setdefault(domain, {'preferred': None, 'failures': {}})
+        # Files written before failure times were kept: treat those failures as expired
+        stats.setdefault('failed_at', {})
+        return stats
+
+    def _order_methods(self, methods: List) -> List:
+        """
+        Put the method that last worked for this domain first and drop methods that keep failing
+        (a dropped method is retried after FAILURE_RETRY_AFTER; all methods are tried if every
+        one of them is skipped)
+        """
+        stats = self._domain_stats()
+        usable = [method for method in methods if not self._is_skipped(method[0])] or methods
+        # Stable sort: only the preferred method moves
+        usable.sort(key=lambda method: method[0] != stats['preferred'])
+        return usable
+
+    def _is_skipped(self, method_name: str) -> bool:
+        """Whether the method failed too often in a row for this domain and is not due for a retry"""
+        stats = self._domain_stats()
+        return (stats['failures'].get(method_name, 0) >= self.MAX_CONSECUTIVE_FAILURES
+                and stats['failed_at'].get(method_name, 0) >= time.time() - self.FAILURE_RETRY_AFTER)
+
+    def _record_attempt(self, method_name: str, success: bool):
+        stats = self._domain_stats()
+        if success:
+            stats['preferred'] = method_name
+            stats['failures'].pop(method_name, None)
+            stats['failed_at'].pop(method_name, None)
+        else:
+            stats['failures'][method_name] = stats['failures'].get(method_name, 0) + 1
+            stats['failed_at'][method_name] = time.time()
+
+    def _load_from_cache(self) -> bool:
+        """Fill html_content from the on-disk cache if available"""
+        if not self.cache:
+            return False
+
+        cached_html = self.cache.load_html()
+        if not cached_html:
+            return False
+
+        self.html_content = cached_html
+        self.successful_method = "Önbellek (cache)"
+        return True
+
+    @classmethod
+    def _get_session(cls):
+        """
+        Return the shared HTTP client (connection pooling + keep-alive)
+        httpx with HTTP/2 when installed (h2 package), else httpx over HTTP/1.1, else requests
+        """
+        if cls._session is None:
+            if HAS_HTTPX:
+                limits = httpx.Limits(max_connections=cls.MAX_WORKERS,
+                                      max_keepalive_connections=cls.MAX_WORKERS)
+                try:
+                    session = httpx.Client(http2=True, headers=cls.REQUEST_HEADERS, limits=limits,
+                                           follow_redirects=True)
+                except ImportError:
+                    # http2=True needs the optional h2 package
+                    session = httpx.Client(headers=cls.REQUEST_HEADERS, limits=limits,
+                                           follow_redirects=True)
+            else:
+                session = requests.Session()
+                session.headers.update(cls.REQUEST_HEADERS)
+                adapter = HTTPAdapter(pool_connections=cls.MAX_WORKERS, pool_maxsize=cls.MAX_WORKERS)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+            cls._session = session
+
+        return cls._session
+
+    @classmethod
+    def scrape_many(cls, urls: List[str], verbose: bool = False, use_cache: bool = True,
+                    max_concurrency: int = None) -> List['JAMAScraper']:
+        """
+        Fetch several articles concurrently: first over the shared keep-alive session
+        (except for domains whose tier history skips it, see _is_skipped), then the misses in parallel Playwright contexts on one browser (or, without
+        Playwright, in a JAMAScraperPool of warm undetected-Chrome processes).
+        The Selenium tiers use fixed debugging ports and stay sequential;
+        articles still missing keep html_content=None and fall back to scrape() later
+        """
+        max_concurrency = max_concurrency or cls.MAX_WORKERS
+        scrapers = [cls(url, verbose=verbose, use_cache=use_cache) for url in urls]
+        pending = [scraper for scraper in scrapers if not scraper._load_from_cache()]
+        attempted = bool(pending)
 
+        def fetch(scraper):
+            try:
+                return scraper._scrape_with_requests()
+            except Exception as e:
+                if verbose:
+                    print(f"❌ {scraper.url} eşzamanlı çekilemedi: {str(e)}")
+                return None
+
+        # Domains that keep rejecting plain HTTP go straight to the browser tiers
+        to_request = [scraper for scraper in pending if not scraper._is_skipped("requests + BeautifulSoup")]
+        if to_request:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(to_request))) as pool:
+                for scraper, html_content in zip(to_request, pool.map(fetch, to_request)):
+                    fetched = bool(html_content) and len(html_content) > 500
+                    scraper._record_attempt("requests + BeautifulSoup", fetched)
+                    if fetched:
+                        cls._store(scraper, html_content, "requests + BeautifulSoup")
+
+        pending = [scraper for scraper in pending if not scraper.html_content]
+        if pending and _has_playwright():
+            try:
+                rendered = asyncio.run(cls._render_many(pending, max_concurrency, verbose))
             except Exception as e:
-                if self.verbose:
-                    print(f"❌ {method_name} başarısız: {str(e)}")
-                continue
+                if verbose:
+                    print(f"❌ Playwright eşzamanlı çekim başarısız: {str(e)}")
+                rendered = []
+            for scraper, html_content in zip(pending, rendered):
+                fetched = bool(html_content) and len(html_content) > 1000
+                scraper._record_attempt("Playwright (stealth)", fetched)
+                if fetched:
+                    cls._store(scraper, html_content, "Playwright (stealth)")
+        elif len(pending) > 1 and _has_uc():
+            try:
+                with JAMAScraperPool(min(JAMAScraperPool.DEFAULT_PROCESSES, len(pending)), verbose) as pool:
+                    rendered = pool.scrape([scraper.url for scraper in pending])
+            except Exception as e:
+                if verbose:
+                    print(f"❌ Undetected Chrome havuzu başarısız: {str(e)}")
+                rendered = []
+            for scraper, html_content in zip(pending, rendered):
+                scraper._record_attempt("Undetected Chrome", bool(html_content))
+                if html_content:
+                    cls._store(scraper, html_content, "Undetected Chrome")
+
+        if attempted and use_cache:
+            cls._save_tier_stats()
+
+        return scrapers
+
+    @staticmethod
+    def _store(scraper: 'JAMAScraper', html_content: str, method: str):
+        """Record HTML fetched by scrape_many on its scraper (and in the cache)"""
+        scraper.html_content = html_content
+        scraper.successful_method = method
+        if scraper.cache:
+            scraper.cache.save_html(html_content)
+
+    @classmethod
+    async def _render_many(cls, scrapers: List['JAMAScraper'], max_concurrency: int, verbose: bool) -> List[str]:
+        """
+        Render articles in up to max_concurrency Playwright contexts sharing one browser
+        Uses the async API: the sync one cannot be driven from several threads
+        """
+        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def block_heavy_resources(route):
+            if cls._is_blocked(route.request):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=cls.PLAYWRIGHT_ARGS)
+
+            async def render(scraper):
+                async with semaphore:
+                    context = await browser.new_context(**cls._context_options())
+                    await context.route("**/*", block_heavy_resources)
+                    try:
+                        page = await context.new_page()
+                        await page.goto(scraper.url, wait_until='domcontentloaded', timeout=40000)
+                        # Event-driven wait for the rendered article; on timeout take what loaded
+                        try:
+                            await page.wait_for_selector(cls.CONTENT_SELECTOR, timeout=cls.CONTENT_WAIT_MS)
+                        except PlaywrightTimeout:
+                            pass
+                        html_content = None
+                        if scraper._trim_page:
+                            html_content = await page.evaluate(cls.ARTICLE_SUBTREE_JS, cls.REQUIRED_META_KEYS)
+                        return html_content or await page.content()
+                    except Exception as e:
+                        if verbose:
+                            print(f"❌ {scraper.url} Playwright ile çekilemedi: {str(e)}")
+                        return None
+                    finally:
+                        await context.close()
 
-        raise Exception("❌ Tüm yöntemler denendi, makale çekilemedi. URL'yi kontrol edin veya erişim sorunu olabilir.")
+            try:
+                return await asyncio.gather(*(render(scraper) for scraper in scrapers))
+            finally:
+                await browser.close()
+
+    @classmethod
+    def _get_browser(cls):
+        """
+        Return the shared Playwright Chromium, launching it on first use (or after a crash)
+        Playwright's sync API is not thread-safe: only use it from the calling thread
+        """
+        if cls._browser is None or not cls._browser.is_connected():
+            if cls._playwright is None:
+                from playwright.sync_api import sync_playwright
+                cls._playwright = sync_playwright().start()
+                atexit.register(cls.shutdown)
+            cls._browser = cls._playwright.chromium.launch(headless=True, args=cls.PLAYWRIGHT_ARGS)
+
+        return cls._browser
+
+    @classmethod
+    def shutdown(cls):
+        """Close the shared browser and stop Playwright (safe to call more than once)"""
+        if cls._browser is not None:
+            try:
+                cls._browser.close()
+            except Exception:
+                pass
+            cls._browser = None
+        if cls._playwright is not None:
+            try:
+                cls._playwright.stop()
+            except Exception:
+                pass
+            cls._playwright = None
+
+    @staticmethod
+    def _context_options() -> dict:
+        """Playwright context settings: randomized desktop viewport, desktop Chrome user agent"""
+        return {
+            'viewport': {'width': random.choice([1920, 1366, 1536]), 'height': random.choice([1080, 768, 864])},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+
+    @property
+    def _trim_page(self) -> bool:
+        """
+        Whether Playwright may return the trimmed document (ARTICLE_SUBTREE_JS)
+        Cached HTML stays the full page so a changed extractor can re-read it without re-scraping
+        """
+        return not self.full_page and self.cache is None
+
+    @classmethod
+    def _is_blocked(cls, request) -> bool:
+        """True for images/media/fonts/stylesheets and analytics calls (aborted before download)"""
+        return (request.resource_type in cls.BLOCKED_RESOURCE_TYPES
+                or any(host in request.url for host in cls.BLOCKED_HOSTS))
 
     def _scrape_with_playwright(self) -> str:
         """Method 1: Playwright - best for bot detection bypass"""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-dev-shm-usage'
-            ])
-
-            context = browser.new_context(
-                viewport={'width': random.choice([1920, 1366, 1536]), 'height': random.choice([1080, 768, 864])},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+        from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
-            page = context.new_page()
+        # Fresh context per article (own cookies/viewport) on the shared browser
+        context = self._get_browser().new_context(**self._context_options())
+        context.route("**/*", lambda route: route.abort() if self._is_blocked(route.request) else route.continue_())
 
-            try:
-                # Navigate and wait for page load
-                page.goto(self.url, wait_until='domcontentloaded', timeout=40000)
+        try:
+            page = context.new_page()
 
-                # Wait for body to ensure page is loaded
-                page.wait_for_selector('body', timeout=10000)
+            # Navigate and wait for page load
+            page.goto(self.url, wait_until='domcontentloaded', timeout=40000)
 
-                # Additional wait for dynamic content
-                time.sleep(random.uniform(2, 4))
+            # Event-driven wait for the rendered article; on timeout take what loaded
+            try:
+                page.wait_for_selector(self.CONTENT_SELECTOR, timeout=self.CONTENT_WAIT_MS)
+            except PlaywrightTimeout:
+                pass
 
-                html_content = page.content()
+            # Only the needed subtree crosses into Python when the page allows it
+            html_content = None
+            if self._trim_page:
+                html_content = page.evaluate(self.ARTICLE_SUBTREE_JS, self.REQUIRED_META_KEYS)
+            html_content = html_content or page.content()
 
-                # Check if we got meaningful content
-                if len(html_content) > 1000:
-                    return html_content
-                else:
-                    raise Exception("Insufficient content received")
+            # Check if we got meaningful content
+            if len(html_content) > 1000:
+                return html_content
+            else:
+                raise Exception("Insufficient content received")
 
-            finally:
-                browser.close()
+        finally:
+            context.close()
 
     def _scrape_with_undetected_chrome(self) -> str:
         """Method 1: Undetected ChromeDriver - bypasses most bot detection"""
+        driver = self._new_uc_driver()
+
+        try:
+            return self._read_with_driver(driver)
+        finally:
+            try:
+                driver.quit()
+            except:
+                pass
+
+    @staticmethod
+    def _new_uc_driver(debugging_port: Optional[int] = 9222):
+        """
+        Start a headless undetected Chrome
+        debugging_port=None lets undetected-chromedriver pick a free port (parallel drivers)
+        """
+        import undetected_chromedriver as uc
+
         options = uc.ChromeOptions()
         options.add_argument('--headless=new')  # Use new headless mode
         options.add_argument('--no-sandbox')
@@ -127,59 +520,71 @@ class JAMAScraper:
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-extensions')
-        options.add_argument('--remote-debugging-port=9222')
+        if debugging_port:
+            options.add_argument(f'--remote-debugging-port={debugging_port}')
 
         # Random window size to appear more human
         window_sizes = ['1920,1080', '1366,768', '1536,864', '1440,900']
         options.add_argument(f'--window-size={random.choice(window_sizes)}')
 
         try:
-            driver = uc.Chrome(options=options, use_subprocess=True, version_main=140)
+            return uc.Chrome(options=options, use_subprocess=True, version_main=140)
         except Exception:
             # Fallback to auto-detect version
-            driver = uc.Chrome(options=options, use_subprocess=True)
+            return uc.Chrome(options=options, use_subprocess=True)
 
-        try:
-            driver.get(self.url)
+    def _read_with_driver(self, driver) -> str:
+        """Load self.url in an already running undetected Chrome and return the rendered HTML"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
 
-            # Human-like behavior: random wait
-            time.sleep(random.uniform(2, 4))
+        driver.get(self.url)
 
-            # Wait for article content
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "article"))
-            )
+        # Human-like behavior: random wait
+        time.sleep(random.uniform(2, 4))
 
-            # Additional random wait to simulate reading
-            time.sleep(random.uniform(1, 2))
+        # Wait for article content
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.TAG_NAME, "article"))
+        )
 
-            html_content = driver.page_source
-            return html_content
-        finally:
-            try:
-                driver.quit()
-            except:
-                pass
+        # Rendered article heading instead of a second fixed wait
+        self._wait_for_content(driver)
 
-    def _scrape_with_requests(self) -> str:
-        """Method 2: Simple requests + BeautifulSoup"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        return driver.page_source
+
+    def _wait_for_content(self, driver):
+        """Selenium: wait until the article heading renders (proceeds with the loaded page on timeout)"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
 
-        response = requests.get(self.url, headers=headers, timeout=10)
+        try:
+            WebDriverWait(driver, self.CONTENT_WAIT_MS / 1000).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.CONTENT_SELECTOR))
+            )
+        except TimeoutException:
+            pass
+
+    def _scrape_with_requests(self) -> str:
+        """Method 2: Simple HTTP GET (httpx or requests) + BeautifulSoup"""
+        response = self._get_session().get(self.url, timeout=10)
         response.raise_for_status()
 
         return response.text
 
     def _scrape_with_selenium_headless(self) -> str:
         """Method 3: Selenium in headless mode with WSL fixes"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        from webdriver_manager.chrome import ChromeDriverManager
+
         chrome_options = Options()
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
@@ -205,7 +610,7 @@ class JAMAScraper:
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.TAG_NAME, "article"))
             )
-            time.sleep(3)  # Additional wait for dynamic content
+            self._wait_for_content(driver)  # Dynamic content, event-driven
 
             html_content = driver.page_source
             return html_content
@@ -217,6 +622,14 @@ class JAMAScraper:
 
     def _scrape_with_selenium_full(self) -> str:
         """Method 4: Selenium with full browser (fallback)"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        from webdriver_manager.chrome import ChromeDriverManager
+
         chrome_options = Options()
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -231,16 +644,117 @@ class JAMAScraper:
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.TAG_NAME, "article"))
             )
-            time.sleep(3)  # Extra wait for all dynamic elements
+            self._wait_for_content(driver)  # Dynamic content, event-driven
 
             html_content = driver.page_source
             return html_content
         finally:
             driver.quit()
 
+    def get_article_root(self):
+        """
+        Return the <article> element of the scraped HTML as an lxml tree (parsed once per HTML)
+        Falls back to the document root when the page has no <article>. Much cheaper than
+        get_soup() for callers that only need XPath / find() over the article body
+        """
+        if not self.html_content:
+            self.scrape()
+
+        if self._article_root is None or self._article_root_html is not self.html_content:
+            import lxml.html
+            root = lxml.html.document_fromstring(self.html_content)
+            article = root.find('.//article')
+            self._article_root = article if article is not None else root
+            self._article_root_html = self.html_content
+
+        return self._article_root
+
     def get_soup(self) -> BeautifulSoup:
-        """Return BeautifulSoup object from scraped HTML"""
+        """
+        Return BeautifulSoup object from scraped HTML (parsed once per HTML)
+        Builds the full document tree; prefer get_article_root() when XPath is enough
+        """
         if not self.html_content:
             self.scrape()
 
-        return BeautifulSoup(self.html_content, 'lxml')
+        if self._soup is None or self._soup_html is not self.html_content:
+            self._soup = BeautifulSoup(self.html_content, HTML_PARSER)
+            self._soup_html = self.html_content
+
+        return self._soup
+
+
+# Per-process state of JAMAScraperPool workers (spawned processes, one driver each)
+_worker_driver = None
+_worker_verbose = False
+
+
+def _init_uc_worker(verbose: bool = False):
+    """
+    Pool initializer: start this worker's undetected Chrome once, quit it when the worker exits
+    Must not raise: Pool respawns a worker whose initializer fails, forever, and map() never returns
+    """
+    global _worker_driver, _worker_verbose
+    _worker_verbose = verbose
+    try:
+        _worker_driver = JAMAScraper._new_uc_driver(debugging_port=None)
+    except Exception as e:
+        # No driver: this worker's URLs come back as None and fall back to scrape()
+        if verbose:
+            print(f"❌ Undetected Chrome başlatılamadı: {str(e)}")
+        return
+    # Pool workers leave through multiprocessing's exit hooks, not atexit
+    multiprocessing.util.Finalize(None, _quit_worker_driver, exitpriority=10)
+
+
+def _quit_worker_driver():
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except Exception:
+            pass
+        _worker_driver = None
+
+
+def _worker_scrape(url: str) -> Optional[str]:
+    """Pool task: render url in this worker's warm driver (None on failure or without a driver)"""
+    if _worker_driver is None:
+        return None
+    try:
+        html_content = JAMAScraper(url, use_cache=False)._read_with_driver(_worker_driver)
+        return html_content if len(html_content) > 1000 else None
+    except Exception as e:
+        if _worker_verbose:
+            print(f"❌ {url} Undetected Chrome ile çekilemedi: {str(e)}")
+        return None
+
+
+class JAMAScraperPool:
+    """
+    Warm undetected-Chrome workers for batch scraping when Playwright is not installed
+    WebDriver is not thread-safe, so each spawned process owns one driver, started once in
+    the pool initializer and reused for every URL it gets (instead of a Chrome launch per URL)
+    """
+
+    DEFAULT_PROCESSES = 2
+
+    def __init__(self, processes: int = None, verbose: bool = False):
+        context = multiprocessing.get_context('spawn')
+        self._pool = context.Pool(processes or self.DEFAULT_PROCESSES,
+                                  initializer=_init_uc_worker, initargs=(verbose,))
+
+    def scrape(self, urls: List[str]) -> List[Optional[str]]:
+        """Rendered HTML per URL, in order (None where the worker failed)"""
+        return self._pool.map(_worker_scrape, urls, chunksize=1)
+
+    def close(self):
+        """Let the workers exit normally so their drivers are quit"""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> 'JAMAScraperPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
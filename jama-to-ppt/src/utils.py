@@ -3,7 +3,54 @@ Utility Functions
 """
 
 import re
-from typing import Dict
+from typing import Dict, Iterable, List
+
+# Prefer the C-based lxml parser for BeautifulSoup, fall back to the stdlib one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Whitespace other than single spaces (runs, tabs, newlines, NBSP...)
+_IRREGULAR_SPACE_RE = re.compile(r'\s\s|[^\S ]')
+_has_irregular_space = _IRREGULAR_SPACE_RE.search
+
+# Filename cleanup (see sanitize_filename): invalid characters are deleted with one
+# str.translate, then whitespace/underscore runs become a single underscore
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_SEPARATOR_RUN_RE = re.compile(r'[\s_]+')
+
+
+def _prefix_tree_pattern(words) -> str:
+    """
+    Regex source matching any of words, factored by common prefixes (a|ab|ac -> a(?:b|c)?)
+    Python's re tries a flat literal alternation branch by branch at every position;
+    the factored form costs one character test per level. Matches the longest word
+    """
+    tree = {}
+    for word in words:
+        node = tree
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # Word ends here; greedy '?' still prefers the longer continuation
+            pattern = '(?:' + pattern + ')?'
+        return pattern
+
+    return build(tree)
+
+
+def _keyword_prefixes(words) -> Dict[str, set]:
+    """Map each word to the words it starts with, itself included"""
+    return {word: {prefix for prefix in words if word.startswith(prefix)} for word in words}
 
 
 class IconSelector:
@@ -22,29 +69,54 @@ class IconSelector:
         'pediatric': ['children', 'pediatric', 'paediatric', 'infant', 'adolescent', 'neonatal', 'child']
     }
 
+    _ALL_KEYWORDS = [keyword for keywords in KEYWORDS_TO_ICON.values() for keyword in keywords]
+
+    # Every keyword as one prefix-factored alternation inside a lookahead: a single C-level
+    # scan yields the longest keyword starting at each position of the text
+    _KEYWORD_SCAN_RE = re.compile(f'(?=({_prefix_tree_pattern(_ALL_KEYWORDS)}))')
+    # Built-in bound method: no descriptor binding when read through cls
+    _scan_keywords = _KEYWORD_SCAN_RE.findall
+    # Shorter keywords hidden inside a longer match at the same position (child -> children)
+    _KEYWORD_PREFIXES = _keyword_prefixes(_ALL_KEYWORDS)
+
+    # Article fields searched for keywords
+    SEARCH_FIELDS = ('title', 'population', 'intervention', 'setting', 'primary_outcome', 'finding_1', 'finding_2')
+
     @classmethod
     def select_icon(cls, article_data: Dict[str, str], verbose: bool = False) -> str:
         """
         Select appropriate icon type based on article content
         Returns icon type string (e.g., 'cardiology', 'neurology', etc.)
         """
-        # Combine all text fields for keyword search
-        search_text = ' '.join([
-            article_data.get('title', ''),
-            article_data.get('population', ''),
-            article_data.get('intervention', ''),
-            article_data.get('setting', ''),
-            article_data.get('primary_outcome', ''),
-            article_data.get('finding_1', ''),
-            article_data.get('finding_2', '')
-        ]).lower()
+        return cls._select_for_text(cls._search_text(article_data), verbose)
+
+    @classmethod
+    def select_icons(cls, articles: Iterable[Dict[str, str]], verbose: bool = False) -> List[str]:
+        """
+        Icon types for several articles, in order (same result as select_icon on each)
+        One pass over the articles with the class-level keyword scan; nothing is recompiled
+        """
+        return [cls._select_for_text(text, verbose) for text in map(cls._search_text, articles)]
+
+    @classmethod
+    def _search_text(cls, article_data: Dict[str, str]) -> str:
+        """All searched fields as one lowercase string"""
+        return ' '.join([article_data.get(field, '') for field in cls.SEARCH_FIELDS]).lower()
+
+    @classmethod
+    def _select_for_text(cls, search_text: str, verbose: bool) -> str:
+        # Keywords present anywhere in the text, from one scan
+        found = set()
+        for longest in set(cls._scan_keywords(search_text)):
+            found |= cls._KEYWORD_PREFIXES[longest]
 
         # Count matches for each category
         matches = {}
-        for category, keywords in cls.KEYWORDS_TO_ICON.items():
-            count = sum(1 for keyword in keywords if keyword in search_text)
-            if count > 0:
-                matches[category] = count
+        if found:
+            for category, keywords in cls.KEYWORDS_TO_ICON.items():
+                count = sum(map(found.__contains__, keywords))
+                if count > 0:
+                    matches[category] = count
 
         # Return category with most matches
         if matches:
@@ -63,11 +135,23 @@ def sanitize_filename(filename: str) -> str:
     Clean filename for safe file system usage
     """
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Replace spaces and multiple underscores
-    filename = re.sub(r'\s+', '_', filename)
-    filename = re.sub(r'_+', '_', filename)
+    filename = _SEPARATOR_RUN_RE.sub('_', filename)
     # Limit length
     if len(filename) > 100:
         filename = filename[:100]
     return filename.strip('_')
+
+
+def word_count(text: str) -> int:
+    """
+    Count whitespace-separated words
+    Single-spaced text is counted without building a list of words
+    """
+    text = text.strip()
+    if not text:
+        return 0
+    if _has_irregular_space(text):
+        return len(text.split())
+    return text.count(' ') + 1